@@ -0,0 +1,236 @@
+"""
+? Name
+ALT (A*, Landmarks, Triangle inequality)
+
+? Description
+Preprocessing for many shortest-path queries on a static graph with
+non-negative weights.
+
+We pick k landmarks L and store d(L, v) and d(v, L) for every node v. By the
+triangle inequality, for any query target t:
+
+    d(v, t) >= d(L, t) - d(L, v)
+    d(v, t) >= d(v, L) - d(t, L)
+
+so the max over all landmarks is an admissible (and consistent) lower bound on
+the remaining distance, which A* uses to steer the search towards t and
+explore far fewer nodes than plain Dijkstra.
+
+The landmark tables are flat array('d') buffers of k * V entries so they can be
+saved to disk once and loaded by worker processes at startup.
+"""
+import os
+import sys
+import struct
+from array import array
+from typing import List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph
+from data_structures.IndexedMinHeap import IndexedMinHeap
+from algorithms_graph.dijkstra import dijkstra_distances
+
+INF = float('inf')
+
+# File header: magic, number of vertices, number of landmarks
+_MAGIC = b'ALT1'
+_HEADER = struct.Struct('<4sII')
+
+class LandmarkIndex:
+    """
+    Landmark distance tables for ALT queries
+
+    Attributes:
+        num_vertices: V of the graph the index was built for.
+        landmarks: array('i') of the k landmark nodes.
+        from_landmark: array('d'), from_landmark[i * V + v] = d(L_i, v)
+        to_landmark: array('d'), to_landmark[i * V + v] = d(v, L_i)
+    """
+    __slots__ = ('num_vertices', 'landmarks', 'from_landmark', 'to_landmark')
+
+    def __init__(self, num_vertices: int, landmarks: array, from_landmark: array, to_landmark: array):
+        self.num_vertices = num_vertices
+        self.landmarks = landmarks
+        self.from_landmark = from_landmark
+        self.to_landmark = to_landmark
+
+    @classmethod
+    def build(
+        cls,
+        graph: CSRGraph,
+        k: int,
+        reverse: Optional[CSRGraph] = None,
+        first: int = 0
+    ) -> 'LandmarkIndex':
+        """
+        Selects k landmarks with the farthest-point heuristic and computes
+        their distance tables.
+
+        Approach:
+            1. Start from `first`, run Dijkstra from it and to it.
+            2. The next landmark is the node whose closest landmark is the
+            farthest away (unreached nodes count as infinitely far, so every
+            component gets a landmark).
+            3. Repeat until there are k landmarks.
+
+        Time Complexity: O(k * E log V)
+        Aux Space Complexity: O(k * V)
+        """
+        V = graph.num_vertices
+        k = min(k, V)
+        if reverse is None:
+            reverse = graph.reverse()
+
+        landmarks = array('i')
+        from_landmark = array('d')
+        to_landmark = array('d')
+        closest = [INF] * V
+
+        landmark = first
+        for _ in range(k):
+            landmarks.append(landmark)
+            dist_from = dijkstra_distances(graph, landmark)
+            dist_to = dijkstra_distances(reverse, landmark)
+            from_landmark.extend(dist_from)
+            to_landmark.extend(dist_to)
+
+            # Farthest node from every landmark chosen so far
+            best, best_dist = -1, -1.0
+            for v in range(V):
+                d = min(dist_from[v], dist_to[v])
+                if d < closest[v]:
+                    closest[v] = d
+                if closest[v] > best_dist and closest[v] > 0:
+                    best, best_dist = v, closest[v]
+            if best == -1:
+                break
+            landmark = best
+
+        return cls(V, landmarks, from_landmark, to_landmark)
+
+    def lower_bound(self, v: int, t: int) -> float:
+        """
+        Admissible lower bound on d(v, t) from the triangle inequality
+
+        Time Complexity: O(k)
+        """
+        V = self.num_vertices
+        fr, to = self.from_landmark, self.to_landmark
+        bound = 0
+        for i in range(len(self.landmarks)):
+            base = i * V
+            # d(v, t) >= d(L, t) - d(L, v)
+            lt, lv = fr[base + t], fr[base + v]
+            if lv != INF:
+                if lt - lv > bound:
+                    bound = lt - lv
+            # d(v, t) >= d(v, L) - d(t, L)
+            vl, tl = to[base + v], to[base + t]
+            if tl != INF:
+                if vl - tl > bound:
+                    bound = vl - tl
+        return bound
+
+    def query(self, graph: CSRGraph, source: int, target: int, arity: int = 4) -> float:
+        """
+        A* search from source to target using the landmark lower bounds
+
+        Args:
+            graph: The graph this index was built for.
+            source: Start node.
+            target: Destination node.
+            arity: Arity of the indexed heap.
+
+        Returns:
+            The shortest distance from source to target, or INF if unreachable.
+
+        Time Complexity: O(k * E log V) worst case, usually far less because
+            the search heads straight for the target.
+        Aux Space Complexity: O(V)
+        """
+        if graph.num_vertices != self.num_vertices:
+            raise ValueError('Landmark index was built for a different graph')
+        V = graph.num_vertices
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+        dist = [INF] * V
+        # Cache of the heuristic, computed once when a node is first reached
+        h: List[Optional[float]] = [None] * V
+        dist[source] = 0
+        h[source] = self.lower_bound(source, target)
+        if h[source] == INF:
+            return INF
+
+        heap = IndexedMinHeap(V, arity)
+        heap.push(source, h[source])
+        while heap:
+            u = heap.pop()
+            if u == target:
+                return dist[u]
+
+            d = dist[u]
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                new_dist = d + weights[e]
+                if new_dist < dist[v]:
+                    if h[v] is None:
+                        h[v] = self.lower_bound(v, target)
+                    # Nodes that cannot reach the target are pruned
+                    if h[v] == INF:
+                        continue
+                    dist[v] = new_dist
+                    heap.push_or_decrease(v, new_dist + h[v])
+
+        return INF
+
+    def save(self, path: str) -> None:
+        """Writes the landmark tables to `path` in a compact binary format"""
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.num_vertices, len(self.landmarks)))
+            self.landmarks.tofile(f)
+            self.from_landmark.tofile(f)
+            self.to_landmark.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> 'LandmarkIndex':
+        """Reads landmark tables written by `save`"""
+        with open(path, 'rb') as f:
+            magic, V, k = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f'{path} is not a landmark index file')
+            landmarks = array('i')
+            from_landmark = array('d')
+            to_landmark = array('d')
+            landmarks.fromfile(f, k)
+            from_landmark.fromfile(f, k * V)
+            to_landmark.fromfile(f, k * V)
+        return cls(V, landmarks, from_landmark, to_landmark)
+
+
+if __name__ == '__main__':
+    import random
+    import tempfile
+
+    # Random directed graph with an unreachable node (V - 1)
+    rng = random.Random(1)
+    V = 200
+    edges = [(rng.randrange(V - 1), rng.randrange(V - 1), rng.randint(1, 20)) for _ in range(800)]
+    graph = CSRGraph.from_edges(edges, num_vertices=V)
+
+    index = LandmarkIndex.build(graph, k=4)
+    for _ in range(100):
+        s, t = rng.randrange(V), rng.randrange(V)
+        exp = dijkstra_distances(graph, s)[t]
+        res = index.query(graph, s, t)
+        assert res == exp, f'Expected {exp} from {s} to {t}, got {res}'
+
+    # Persist the tables and answer the same queries from the loaded copy
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'landmarks.alt')
+        index.save(path)
+        loaded = LandmarkIndex.load(path)
+    assert list(loaded.landmarks) == list(index.landmarks)
+    assert loaded.from_landmark == index.from_landmark
+    assert loaded.query(graph, 0, 5) == dijkstra_distances(graph, 0)[5]
+
+    print('All tests passed')
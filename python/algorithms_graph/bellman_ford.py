@@ -1,4 +1,16 @@
-from typing import List, Tuple
+import os
+import sys
+from array import array
+from collections import deque
+from typing import List, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 Weight = int
 Node = int
@@ -6,14 +18,224 @@ Edge = Tuple[Weight, Node, Node]
 
 INF = float('inf')
 
-def bellman_ford(edges: List[Edge], s: Node) -> Tuple[List, List]:
+# Relaxation strategies and backends of the shared engine
+METHODS = ('spfa', 'passes')
+BACKENDS = ('python', 'numpy')
+
+def bellman_ford_search(
+    graph: CSRGraph,
+    s: Node,
+    method: str = 'spfa',
+    backend: str = 'python'
+) -> Tuple[List, List, bytearray]:
+    """
+    Shared Bellman-Ford engine over a CSR graph, with negative-cycle marking
+    
+    Args:
+        graph: Directed graph, weights may be negative.
+        s: The source node.
+        method: Relaxation strategy, one of:
+            - 'passes': full passes over the edges, stopping early as soon as
+              a pass relaxes nothing
+            - 'spfa': FIFO worklist of the nodes whose distance dropped, so
+              only edges out of those nodes are relaxed again
+        backend: 'python', or 'numpy' to run every pass as vectorized array
+            operations over all edges (always full passes, `method` is
+            ignored). Needs NumPy.
+    
+    Returns:
+        A tuple (dist, pred, cyclic)
+        dist[v] is the shortest distance from s to v (INF if unreachable).
+        pred[v] is the predecessor of v on that path (None if none).
+        cyclic[v] is 1 if v lies on or is reachable from a negative cycle
+        reachable from s; dist[v] and pred[v] are meaningless for those nodes.
+    
+    Time Complexity: O(V * E) worst case, but typical graphs converge in a few
+        passes (or a few visits per node with 'spfa').
+    Aux Space Complexity: O(V)
+    """
+    if backend == 'numpy':
+        if np is None:
+            raise ImportError('NumPy is not installed')
+        dist, pred, cyclic = _passes_numpy(graph, s)
+    elif backend != 'python':
+        raise ValueError(f'Unknown backend {backend!r}, expected one of {BACKENDS}')
+    elif method == 'spfa':
+        dist, pred, cyclic = _spfa(graph, s)
+    elif method == 'passes':
+        dist, pred, cyclic = _passes(graph, s)
+    else:
+        raise ValueError(f'Unknown method {method!r}, expected one of {METHODS}')
+    
+    # Everything on or after a flagged node (nothing to do on the usual
+    # no-negative-cycle path)
+    if any(cyclic):
+        _flag_reachable(graph, cyclic)
+    return dist, pred, cyclic
+
+def _flag_reachable(graph: CSRGraph, flags: bytearray) -> None:
+    """BFS from every flagged node, flagging everything it reaches. O(V + E)"""
+    offsets, targets = graph.offsets, graph.targets
+    queue = deque(v for v in range(graph.num_vertices) if flags[v])
+    while queue:
+        u = queue.popleft()
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            if not flags[v]:
+                flags[v] = 1
+                queue.append(v)
+
+def _passes(graph: CSRGraph, s: Node) -> Tuple[List, List, bytearray]:
+    """Classic V-1 passes with an early exit. Seeds the cyclic flags."""
+    V = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    
+    dist = [INF] * V
+    pred = [None] * V
+    dist[s] = 0
+    cyclic = bytearray(V)
+    
+    for _ in range(V - 1):
+        changed = False
+        for u in range(V):
+            # Only edges out of u where a path to u exists can relax anything
+            d = dist[u]
+            if d == INF:
+                continue
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                if d + weights[e] < dist[v]:
+                    dist[v] = d + weights[e]
+                    pred[v] = u
+                    changed = True
+        # Early exit: the distances are final once a pass changes nothing
+        if not changed:
+            return dist, pred, cyclic
+    
+    # One more pass: any edge that still relaxes leads out of a negative cycle
+    for u in range(V):
+        d = dist[u]
+        if d == INF:
+            continue
+        for e in range(offsets[u], offsets[u + 1]):
+            if d + weights[e] < dist[targets[e]]:
+                cyclic[targets[e]] = 1
+    
+    return dist, pred, cyclic
+
+def _passes_numpy(graph: CSRGraph, s: Node) -> Tuple[List, List, bytearray]:
+    """
+    Full passes as NumPy array operations. Seeds the cyclic flags.
+    
+    The edges are three parallel arrays src, dst, w. A pass gathers
+    dist[src] + w for every edge at once and scatters the minimum per
+    destination with np.minimum.at. Every pass reads the distances of the
+    previous one, so a shortest path of k edges is final after k passes and
+    the V-1 bound still holds.
+    """
+    V = graph.num_vertices
+    offsets = np.frombuffer(graph.offsets, dtype=np.int32)
+    dst = np.frombuffer(graph.targets, dtype=np.int32).astype(np.intp)
+    src = np.repeat(np.arange(V, dtype=np.intp), np.diff(offsets))
+    # Distances are float64 so INF fits, integral weights are restored below
+    w = np.array(graph.weights, dtype=np.float64)
+    
+    dist = np.full(V, np.inf)
+    dist[s] = 0
+    pred = np.full(V, -1, dtype=np.intp)
+    cyclic = bytearray(V)
+    
+    converged = False
+    for _ in range(V - 1):
+        candidate = dist[src] + w
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, dst, candidate)
+        
+        improved = new_dist < dist
+        # Early exit: the distances are final once a pass changes nothing
+        if not improved.any():
+            converged = True
+            break
+        
+        # Any edge achieving the new minimum of an improved node is its pred
+        winners = improved[dst] & (candidate == new_dist[dst])
+        pred[dst[winners]] = src[winners]
+        dist = new_dist
+    
+    if not converged:
+        # One more pass: any edge that still relaxes leads out of a negative cycle
+        seeds = np.unique(dst[dist[src] + w < dist[dst]])
+        for v in seeds.tolist():
+            cyclic[v] = 1
+    
+    if graph.integral:
+        dist_list = [INF if d == INF else int(d) for d in dist.tolist()]
+    else:
+        dist_list = dist.tolist()
+    pred_list = [None if p == -1 else p for p in pred.tolist()]
+    return dist_list, pred_list, cyclic
+
+def _spfa(graph: CSRGraph, s: Node) -> Tuple[List, List, bytearray]:
+    """
+    SPFA: FIFO worklist Bellman-Ford. Seeds the cyclic flags.
+    
+    Without a reachable negative cycle, a node is queued at most once per
+    round of the FIFO order and there are at most V-1 rounds. So a node queued
+    V times can be reached from a negative cycle: it is flagged and never
+    queued again, which also breaks the cycle and guarantees termination.
+    """
+    V = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    
+    dist = [INF] * V
+    pred = [None] * V
+    dist[s] = 0
+    cyclic = bytearray(V)
+    
+    # Per-node count of times it was queued
+    count = array('i', [0]) * V
+    in_queue = bytearray(V)
+    queue = deque([s])
+    in_queue[s] = 1
+    
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        if cyclic[u]:
+            continue
+        
+        d = dist[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            new_dist = d + weights[e]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                pred[v] = u
+                if not in_queue[v] and not cyclic[v]:
+                    count[v] += 1
+                    if count[v] >= V:
+                        cyclic[v] = 1
+                        continue
+                    in_queue[v] = 1
+                    queue.append(v)
+    
+    return dist, pred, cyclic
+
+def bellman_ford(
+    edges: Union[List[Edge], CSRGraph],
+    s: Node,
+    method: str = 'spfa',
+    backend: str = 'python'
+) -> Tuple[List, List]:
     """
     ! Finds shortest paths from source s using Bellman-Ford
     
     Args:
-        edges: List of edges in the format (weight, u, v)
+        edges: List of edges in the format (weight, u, v), or a CSRGraph
         s: The source node index (0-based)
-        v: Optional. The total number of vertices. If None, inferred from edges.
+        method: 'spfa' (FIFO worklist) or 'passes' (full passes with an
+            early exit), see bellman_ford_search
+        backend: 'python' or 'numpy' (vectorized passes)
         
     Returns:
         A tuple (dist, pred)
@@ -21,37 +243,12 @@ def bellman_ford(edges: List[Edge], s: Node) -> Tuple[List, List]:
         pred[i] is the predecessor of i in the shortest path from s
         Raises ValueError if a negative cycle is detected
     """
-    # Find maximum no. of vertices
-    V = 0
-    for edge in edges:
-        V = max(V, edge[1], edge[2])
-    V += 1
+    # Build the CSR graph once (or reuse the one passed in)
+    graph = as_csr(edges, weight_first=True)
+    dist, pred, cyclic = bellman_ford_search(graph, s, method, backend)
     
-    # Setup distance and predecessor lists
-    dist = [INF for _ in range(V)]
-    pred = [None for _ in range(V)]
-    
-    # Starting vertex distance is zero
-    dist[s] = 0
-    
-    # * --- Main Relaxation Phase ---
-    # Iterate V-1 times
-    for _ in range(V-1):
-        for edge in edges:
-            w, u, v = edge
-            
-            # Check if path through u is shorter AND path to u exists
-            if dist[u] != INF and dist[u] + w < dist[v]:
-                dist[v] = dist[u] + w
-                pred[v] = u
-                
-    # * --- Negative Cycle Detection Phase ---
-    # Perform one more pass through all edges
-    for edge in edges:
-        w, u, v = edge
-        if dist[u] != INF and dist[u] + w < dist[v]:
-            # If we can still relax an edge, a negative cycle exists
-            raise ValueError('Graph contains a negative-weight cycle reachable from the source')
+    if any(cyclic):
+        raise ValueError('Graph contains a negative-weight cycle reachable from the source')
     
     return dist, pred
     
@@ -103,4 +300,20 @@ if __name__ == '__main__':
     try:
         bellman_ford(edges, source)
     except ValueError as e:
-        print(f'Caught excepted error: {e}')
\ No newline at end of file
+        print(f'Caught excepted error: {e}')
+    
+    # Nodes after the cycle 1 -> 2 -> 1 are flagged too, 4 is not reachable
+    # from it
+    graph = as_csr([(1, 0, 1), (1, 1, 2), (-3, 2, 1), (1, 2, 3), (1, 0, 4)], weight_first=True)
+    for method in METHODS:
+        assert list(bellman_ford_search(graph, 0, method)[2]) == [0, 1, 1, 1, 0]
+    
+    # The NumPy backend gives the same distances and detects the same cycle
+    if np is not None:
+        edges = [(6, 0, 1), (7, 0, 2), (5, 1, 2), (-4, 1, 4), (2, 2, 3), (3, 3, 4), (9, 3, 1)]
+        assert bellman_ford(edges, 0, backend='numpy')[0] == bellman_ford(edges, 0)[0]
+        try:
+            bellman_ford([(1, 0, 1), (1, 1, 2), (-3, 2, 0)], 0, backend='numpy')
+            assert False, 'Expected a negative cycle'
+        except ValueError:
+            pass
\ No newline at end of file
@@ -0,0 +1,284 @@
+"""
+? Name
+Connection Scan Algorithm (CSA)
+
+? Description
+Earliest-arrival queries on a timetable of connections (u, v, d, a): a
+vehicle leaves stop u at time d and reaches stop v at time a (d < a).
+
+Instead of running Dijkstra over (time, stop) states, the connections are
+sorted by departure time ONCE and stored as parallel arrays. A query then
+scans them in order: a connection can be taken if we are at its departure
+stop by its departure time, and if so it may improve the arrival time at its
+arrival stop. Because every connection departs no earlier than the ones
+before it, a single linear pass is enough, and it can stop as soon as the
+departures are past the best known arrival at the target.
+
+The index is built once and answers many queries, reusing one scratch
+buffer of arrival times between them.
+
+Profile queries answer "earliest arrival at T for EVERY departure time from S"
+with one scan over the connections in reverse (latest departure first),
+keeping for every stop the Pareto set of (departure, arrival at T) pairs.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+INF = float('inf')
+
+Connection = Tuple[int, int, int, int]
+
+class ArrivalProfile:
+    """
+    Step function mapping a departure time to the earliest arrival time
+
+    Stored as the Pareto-optimal breakpoints (departures[i], arrivals[i]),
+    both strictly increasing: leaving at time t, the best plan is the first
+    breakpoint that departs at or after t.
+    """
+    __slots__ = ('departures', 'arrivals')
+
+    def __init__(self, departures: array, arrivals: array):
+        self.departures = departures
+        self.arrivals = arrivals
+
+    def evaluate(self, t) -> float:
+        """
+        Earliest arrival when ready to leave at time t (INF if none)
+
+        Time Complexity: O(log n)
+        """
+        i = bisect_left(self.departures, t)
+        if i == len(self.departures):
+            return INF
+        return self.arrivals[i]
+
+    def __len__(self) -> int:
+        return len(self.departures)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return zip(self.departures, self.arrivals)
+
+    def __repr__(self) -> str:
+        return f'ArrivalProfile({list(self)})'
+
+
+class IdentityProfile(ArrivalProfile):
+    """
+    Profile of a stop to itself: already there, so the arrival is the
+    departure time. It has no breakpoints, evaluate(t) is t.
+    """
+    __slots__ = ()
+
+    def __init__(self, typecode: str = 'q'):
+        super().__init__(array(typecode), array(typecode))
+
+    def evaluate(self, t):
+        return t
+
+    def __repr__(self) -> str:
+        return 'IdentityProfile()'
+
+
+class ConnectionScan:
+    """
+    Prebuilt Connection Scan index
+
+    Attributes:
+        num_stops: Stops are numbered 0..num_stops-1.
+        dep_stop, arr_stop: array('i') of the departure/arrival stop of each
+            connection, sorted by departure time.
+        dep_time, arr_time: array('q') (or array('d') for float times) of the
+            departure/arrival time of each connection.
+    """
+    __slots__ = ('num_stops', 'dep_stop', 'arr_stop', 'dep_time', 'arr_time', '_best', '_touched')
+
+    def __init__(self, num_stops: int, connections: Iterable[Connection]):
+        """
+        Sorts the connections by departure time into parallel arrays
+
+        Time Complexity: O(M log M)
+        Aux Space Complexity: O(N + M)
+        """
+        connections = sorted(connections, key=lambda c: c[2])
+        integral = all(type(d) is int and type(a) is int for _, _, d, a in connections)
+        typecode = 'q' if integral else 'd'
+
+        self.num_stops = num_stops
+        self.dep_stop = array('i', [c[0] for c in connections])
+        self.arr_stop = array('i', [c[1] for c in connections])
+        self.dep_time = array(typecode, [c[2] for c in connections])
+        self.arr_time = array(typecode, [c[3] for c in connections])
+
+        # Scratch buffer shared by all queries, reset via the touched list
+        self._best: List = [INF] * num_stops
+        self._touched: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.dep_time)
+
+    def earliest_arrival(self, start: int, end: int, depart_time=0) -> float:
+        """
+        Earliest arrival time at `end` when leaving `start` at `depart_time`
+
+        Approach:
+        - Binary search for the first connection departing at or after
+        `depart_time`.
+        - Scan forward, taking every connection whose departure stop has been
+        reached by its departure time, improving best[arrival stop].
+        - Stop once connections depart at or after best[end], since no later
+        connection can arrive any earlier.
+
+        Returns:
+            The earliest arrival time at `end`, or INF if unreachable.
+
+        Time Complexity: O(log M + K) where K is the number of connections
+            scanned, at most M.
+        Aux Space Complexity: O(1) extra (the scratch buffer is reused)
+        """
+        if start == end:
+            return depart_time
+
+        best, touched = self._best, self._touched
+        dep_stop, arr_stop = self.dep_stop, self.arr_stop
+        dep_time, arr_time = self.dep_time, self.arr_time
+
+        best[start] = depart_time
+        touched.append(start)
+
+        for i in range(bisect_left(dep_time, depart_time), len(dep_time)):
+            d = dep_time[i]
+            # Early exit: nothing departing now can beat the current best
+            if d >= best[end]:
+                break
+            if best[dep_stop[i]] <= d:
+                v = arr_stop[i]
+                a = arr_time[i]
+                if a < best[v]:
+                    if best[v] == INF:
+                        touched.append(v)
+                    best[v] = a
+
+        result = best[end]
+
+        for stop in touched:
+            best[stop] = INF
+        touched.clear()
+
+        return result
+
+    def profile(self, start: int, end: int) -> ArrivalProfile:
+        """
+        Earliest arrival at `end` for every departure time from `start`
+
+        Approach:
+        - Scan the connections from the latest departure to the earliest.
+        - Every stop keeps its Pareto pairs (departure, arrival at `end`) in
+        the order they were found, i.e. decreasing departure AND decreasing
+        arrival, so "best arrival when at stop v by time a" is a binary search
+        for the last pair departing at or after a.
+        - For a connection u -> v departing d and arriving a, the arrival at
+        `end` is a itself if v == end, otherwise the best of v's profile from
+        time a. Every connection v could use departs after a > d, so it has
+        already been scanned.
+        - The pair (d, arrival) is kept at u only if it arrives strictly
+        earlier than u's latest pair (which departs no earlier than d).
+
+        Returns:
+            The profile of `start` as an ArrivalProfile step function, or an
+            IdentityProfile (arrival = departure) if start == end.
+
+        Time Complexity: O(M log M)
+        Aux Space Complexity: O(N + M)
+        """
+        if start == end:
+            return IdentityProfile(self.dep_time.typecode)
+
+        dep_stop, arr_stop = self.dep_stop, self.arr_stop
+        dep_time, arr_time = self.dep_time, self.arr_time
+
+        # Per stop: negated departures (ascending) and arrivals at `end`
+        neg_deps: List[List] = [[] for _ in range(self.num_stops)]
+        arrivals: List[List] = [[] for _ in range(self.num_stops)]
+
+        for i in range(len(dep_time) - 1, -1, -1):
+            u = dep_stop[i]
+            if u == end:
+                continue
+            v = arr_stop[i]
+            a = arr_time[i]
+
+            if v == end:
+                arrival = a
+            else:
+                j = bisect_right(neg_deps[v], -a) - 1
+                if j < 0:
+                    continue
+                arrival = arrivals[v][j]
+
+            u_deps, u_arrs = neg_deps[u], arrivals[u]
+            if u_arrs and arrival >= u_arrs[-1]:
+                continue
+            d = dep_time[i]
+            if u_deps and u_deps[-1] == -d:
+                # Same departure time, strictly better arrival
+                u_arrs[-1] = arrival
+            else:
+                u_deps.append(-d)
+                u_arrs.append(arrival)
+
+        typecode = dep_time.typecode
+        departures = array(typecode, [-d for d in reversed(neg_deps[start])])
+        profile_arrivals = array(typecode, reversed(arrivals[start]))
+        return ArrivalProfile(departures, profile_arrivals)
+
+    def earliest_arrivals(self, queries: Iterable[Sequence[int]]) -> array:
+        """
+        Answers a batch of (start, end) or (start, end, depart_time) queries
+
+        Returns:
+            array('d') of the earliest arrival time for each query (INF if
+            unreachable), in query order.
+        """
+        results = array('d')
+        for query in queries:
+            results.append(self.earliest_arrival(*query))
+        return results
+
+
+if __name__ == '__main__':
+    # 1→2 (1–5), 1→3 (2–3), 3→2 (4–6), 2→4 (6–8), 3→4 (7–9)
+    flights = [
+        (1, 2, 1, 5),
+        (1, 3, 2, 3),
+        (3, 2, 4, 6),
+        (2, 4, 6, 8),
+        (3, 4, 7, 9),
+    ]
+    csa = ConnectionScan(5, flights)
+
+    assert csa.earliest_arrival(1, 4) == 8
+    assert csa.earliest_arrival(1, 2) == 5
+    assert csa.earliest_arrival(4, 1) == INF
+    # Leaving at time 2 misses the 1→2 flight, but 1→3→2→4 still arrives at 8
+    assert csa.earliest_arrival(1, 4, depart_time=2) == 8
+    assert csa.earliest_arrival(3, 4, depart_time=5) == 9
+    assert csa.earliest_arrival(1, 4, depart_time=3) == INF
+
+    res = list(csa.earliest_arrivals([(1, 4), (3, 4), (1, 4, 2), (2, 2)]))
+    exp = [8, 8, 8, 0]
+    assert res == exp, f'Expected {exp}, got {res}'
+
+    # Profile from 1 to 4: leave by 2 to arrive at 8, otherwise unreachable
+    profile = csa.profile(1, 4)
+    assert list(profile) == [(2, 8)], f'Unexpected profile {profile}'
+    for t in range(12):
+        assert profile.evaluate(t) == csa.earliest_arrival(1, 4, t)
+
+    # A stop to itself agrees with earliest_arrival: arrive when leaving
+    profile = csa.profile(2, 2)
+    for t in range(12):
+        assert profile.evaluate(t) == csa.earliest_arrival(2, 2, t) == t
+
+    print('All tests passed')
@@ -1,19 +1,24 @@
-from typing import List, Tuple, Optional
+import os
+import sys
+from typing import List, Tuple, Optional, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
 
 Weight = int
 Vertex = int
 Edge = Tuple[Weight, Vertex, Vertex]
-AdjacencyList = List[List[Tuple[Weight, Vertex]]]
 Memo = List[Optional[Weight]]
 
-def critical_path(edges: List[Edge], start_vertex: Vertex):
+def critical_path(edges: Union[List[Edge], CSRGraph], start_vertex: Vertex):
     """
     Calculates the length of the longest path (critical path) in a DAG
     starting from a given node using recursion with memoisation.
     
     Args:
         edges: A list of edges, where each edge is (weight, u, v).
-                Nodes u and v are assumed to be 0-indexed.
+                Nodes u and v are assumed to be 0-indexed. A CSRGraph is
+                also accepted.
                 
         start_node: The node from which to start finding the longest path.
         
@@ -32,22 +37,14 @@ def critical_path(edges: List[Edge], start_vertex: Vertex):
         The space is dominated by the adjacency list and potentially the call
         stack/memo table.
     """
-    # Find n (number of vertices = max_index + 1)
-    n = -1
-    for edge in edges:
-        n = max(n, edge[1], edge[2])
-    n += 1
-    
-    # Init graph as an adjacency list
-    graph: AdjacencyList = [[] for _ in range(n)]
-    for edge in edges:
-        w, u, v = edge
-        graph[u].append((w, v))
+    # Build the CSR graph once (or reuse the one passed in)
+    graph = as_csr(edges, weight_first=True)
+    n = graph.num_vertices
         
     # Initialise memoisation table (using dictionary here)
     longest: Memo = [None] * n
     
-    def find_longest_path(curr_vertex: Vertex, graph: AdjacencyList, longest: Memo) -> Weight:
+    def find_longest_path(curr_vertex: Vertex, graph: CSRGraph, longest: Memo) -> Weight:
         """Recursive helper function to find the longest path starting from curr_node"""
         # * 1. Check memoisation table (base case for recursion)
         if longest[curr_vertex] is not None:
@@ -57,7 +54,7 @@ def critical_path(edges: List[Edge], start_vertex: Vertex):
         # Longest path *from* this vertex is 0 if it's a sink
         max_len = 0 
         # Iterate through outgoing edges from curr_vertex
-        for weight, neighbour in graph[curr_vertex]:
+        for neighbour, weight in graph.neighbours(curr_vertex):
             # Recursively find the longest path starting from the neighbour
             path_from_neighbour = find_longest_path(neighbour, graph, longest)
             
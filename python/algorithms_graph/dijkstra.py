@@ -1,50 +1,359 @@
-from typing import List, Tuple
-from heapq import heappop
-from heapq import heappush
-
-def dijkstra(edges: List[Tuple[int, int, int]], start):
-    # Find the no of nodes
-    max_node = 0
-    for edge in edges:
-        max_node = max(max_node, edge[0], edge[1])
-    
-    # Build the adjacency matrix
-    adj = {}
-    for i in range(max_node):
-        adj[i] = []
-        
-    for u, v, weight in edges:
-        adj[u].append([v, weight])
-        
-    # Map of shortest paths from source to node (init as infinity)
-    shortest = {i: float('inf') for i in range(max_node)}
+import os
+import sys
+from typing import List, Optional, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+from data_structures.IndexedMinHeap import IndexedMinHeap
+
+INF = float('inf')
+
+# Queue strategies of the shared Dijkstra
+QUEUES = ('auto', 'heap', 'bucket', 'radix')
+
+# Max edge weight up to which 'auto' picks the bucket queue (see
+# benchmarks/bench_dijkstra_queues.py for the crossover)
+BUCKET_MAX_WEIGHT = 1 << 16
+# ... and it also has to be at most this many times the number of edges: the
+# C + 1 buckets are allocated and scanned on every query, which swamps the
+# search itself on small graphs
+BUCKET_WEIGHT_PER_EDGE = 1
+
+def choose_queue(graph: CSRGraph) -> str:
+    """
+    Picks the queue strategy for a graph from its edge weights and size:
+    - 'bucket' (Dial) for integer weights up to C <= min(BUCKET_MAX_WEIGHT,
+      BUCKET_WEIGHT_PER_EDGE * E)
+    - 'radix' for other non-negative integer weights
+    - 'heap' otherwise (e.g. float weights)
+    """
+    if not graph.integral:
+        return 'heap'
+    if graph.max_weight() <= min(BUCKET_MAX_WEIGHT, BUCKET_WEIGHT_PER_EDGE * graph.num_edges):
+        return 'bucket'
+    return 'radix'
+
+def dijkstra_distances(
+    graph: CSRGraph,
+    start: int,
+    target: Optional[int] = None,
+    arity: int = 4,
+    queue: str = 'auto'
+) -> List:
+    """
+    Dijkstra's shortest paths from `start` over a CSR graph
+
+    Args:
+        graph: Directed graph with non-negative weights.
+        start: The source node.
+        target: Optional. If given, the search stops as soon as `target` is
+            settled, so only nodes closer than the target are explored.
+        arity: Arity of the indexed heap.
+        queue: Priority queue strategy, one of:
+            - 'heap': indexed d-ary heap, O(E log V), any weights
+            - 'bucket': Dial's bucket queue, O(E + V * C), integer weights <= C
+            - 'radix': radix heap, O(E + V log C), integer weights <= C
+            - 'auto': chosen from the maximum edge weight and the number of
+              edges (see choose_queue)
+
+    Returns:
+        dist where dist[v] is the shortest distance from start to v, or INF if
+        v is unreachable. With a `target`, only dist[target] (and the nodes
+        settled before it) are final.
+
+    Aux Space Complexity: O(V + C) for 'bucket', O(V) otherwise
+    """
+    if queue == 'auto':
+        queue = choose_queue(graph)
+    if queue == 'heap':
+        return _dijkstra_heap(graph, start, target, arity)
+    if queue not in QUEUES:
+        raise ValueError(f'Unknown queue strategy {queue!r}, expected one of {QUEUES}')
+    if not graph.integral:
+        raise ValueError(f'The {queue!r} queue needs integer edge weights')
+    if queue == 'bucket':
+        return _dijkstra_bucket(graph, start, target)
+    return _dijkstra_radix(graph, start, target)
+
+def _dijkstra_heap(graph: CSRGraph, start: int, target: Optional[int], arity: int) -> List:
+    """Dijkstra with the indexed d-ary heap. O(E log V)"""
+    V = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    shortest = [INF] * V
     shortest[start] = 0
-    
-    # Priority queue to explore nodes, starting from the source
-    min_heap = [(start, 0)] # (node, weight)
-    
+
+    # Indexed priority queue keyed by distance, holding each node at most once
+    min_heap = IndexedMinHeap(V, arity)
+    min_heap.push(start, 0)
+
     while min_heap:
-        node, weight = heappop(min_heap)
+        node = min_heap.pop()
+
+        # Early exit: the target's distance is final once it is settled
+        if node == target:
+            break
+
+        weight = shortest[node]
+        for e in range(offsets[node], offsets[node + 1]):
+            new_node = targets[e]
+            new_dist = weight + weights[e]
+            if new_dist < shortest[new_node]:
+                shortest[new_node] = new_dist
+                min_heap.push_or_decrease(new_node, new_dist)
 
-        # Only proceed if the current path is still relevant
-        if weight > shortest[node]:
+    return shortest
+
+def _dijkstra_bucket(graph: CSRGraph, start: int, target: Optional[int]) -> List:
+    """
+    Dial's algorithm: a circular array of C + 1 buckets indexed by distance.
+
+    Every tentative distance lies in [d, d + C] for the current distance d, so
+    bucket (dist % (C + 1)) is unambiguous. A node is appended each time its
+    distance drops and stale entries (dist[u] != d) are skipped when popped.
+
+    Time Complexity: O(E + V * C), the scan over empty buckets is the V * C
+    """
+    V = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    num_buckets = graph.max_weight() + 1
+
+    shortest = [INF] * V
+    shortest[start] = 0
+    buckets: List[List[int]] = [[] for _ in range(num_buckets)]
+    buckets[0].append(start)
+    pending = 1
+
+    d = 0
+    while pending:
+        # Advance to the next non-empty bucket
+        bucket = buckets[d % num_buckets]
+        while not bucket:
+            d += 1
+            bucket = buckets[d % num_buckets]
+
+        node = bucket.pop()
+        pending -= 1
+        if shortest[node] != d:
             continue
-        
-        for new_node, new_weight in adj[node]:
-            new_dist = weight + new_weight
+        if node == target:
+            break
+
+        for e in range(offsets[node], offsets[node + 1]):
+            new_node = targets[e]
+            new_dist = d + weights[e]
             if new_dist < shortest[new_node]:
                 shortest[new_node] = new_dist
-                heappush(min_heap, (new_node, new_dist))
-        
-        # Check for any nodes that were not reachable
-        for i in range(max_node):
-            if shortest[i] == float('inf'):
-                shortest[i] = -1
-                
+                buckets[new_dist % num_buckets].append(new_node)
+                pending += 1
+
     return shortest
-        
-    
-    
+
+def _dijkstra_radix(graph: CSRGraph, start: int, target: Optional[int]) -> List:
+    """
+    Dijkstra with a radix heap (monotone integer priority queue).
+
+    Bucket i holds the nodes whose distance differs from the last popped
+    distance `last` in bit i-1 as the highest differing bit, i.e. bucket
+    (dist ^ last).bit_length(). When bucket 0 is empty, the first non-empty
+    bucket is emptied, `last` becomes its minimum and its nodes are spread into
+    lower buckets. A node only ever moves down, so it is moved O(log C) times.
+    Buckets hold node ids only (keys are read from `shortest`), so there are
+    no per-entry tuples.
+
+    Time Complexity: O(E + V log C)
+    """
+    V = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    shortest = [INF] * V
+    shortest[start] = 0
+    settled = bytearray(V)
+
+    # Distances are < 2^64, so (dist ^ last).bit_length() <= 64
+    buckets: List[List[int]] = [[] for _ in range(65)]
+    bucket0 = buckets[0]
+    bucket0.append(start)
+    last = 0
+
+    while True:
+        if not bucket0:
+            # Redistribute the first non-empty bucket around its minimum
+            i = 1
+            while i < 65 and not buckets[i]:
+                i += 1
+            if i == 65:
+                break
+            live = [v for v in buckets[i] if not settled[v]]
+            buckets[i] = []
+            if not live:
+                continue
+            last = min([shortest[v] for v in live])
+            for v in live:
+                buckets[(shortest[v] ^ last).bit_length()].append(v)
+
+        node = bucket0.pop()
+        # Duplicate entries of a node are skipped once it is settled
+        if settled[node]:
+            continue
+        settled[node] = 1
+        if node == target:
+            break
+
+        d = shortest[node]
+        for e in range(offsets[node], offsets[node + 1]):
+            new_node = targets[e]
+            new_dist = d + weights[e]
+            if new_dist < shortest[new_node]:
+                shortest[new_node] = new_dist
+                buckets[(new_dist ^ last).bit_length()].append(new_node)
+
+    return shortest
+
+def dijkstra(
+    edges: Union[List[Tuple[int, int, int]], CSRGraph],
+    start,
+    target: Optional[int] = None,
+    arity: int = 4,
+    queue: str = 'auto'
+):
+    """
+    Dijkstra's shortest paths from `start`
+
+    Args:
+        edges: List of directed edges (u, v, w), or a prebuilt CSRGraph.
+        start: The source node.
+        target: Optional. Stop as soon as `target` is settled.
+        arity: Arity of the indexed heap.
+        queue: Priority queue strategy ('auto', 'heap', 'bucket', 'radix').
+
+    Returns:
+        shortest where shortest[v] is the distance from start to v, or -1 if
+        v was not reached.
+
+    Time Complexity: O(E log V)
+    """
+    # Build the CSR graph once (or reuse the one passed in)
+    graph = as_csr(edges)
+    shortest = dijkstra_distances(graph, start, target, arity, queue)
+
+    # Mark the nodes that were not reachable (once, after the search)
+    for i in range(graph.num_vertices):
+        if shortest[i] == INF:
+            shortest[i] = -1
+
+    return shortest
+
+def bidirectional_dijkstra(
+    graph: CSRGraph,
+    source: int,
+    target: int,
+    reverse: Optional[CSRGraph] = None,
+    arity: int = 4
+) -> float:
+    """
+    Bidirectional Dijkstra for a single source-target pair
+
+    Runs a forward search from `source` over `graph` and a backward search from
+    `target` over the reverse graph, always expanding the side whose queue has
+    the smaller key. `mu` tracks the best source -> target path seen through a
+    node reached by both searches, and the search stops once
+    top(forward) + top(backward) >= mu, because no unexplored path can beat it.
+
+    Args:
+        graph: Directed graph with non-negative weights.
+        source: Start node.
+        target: Destination node.
+        reverse: Optional prebuilt `graph.reverse()`, so it is built once when
+            answering many queries.
+        arity: Arity of the indexed heaps.
+
+    Returns:
+        The shortest distance from source to target, or INF if unreachable.
+
+    Time Complexity: O(E log V) worst case, but on large sparse graphs each
+        search only explores a ball of about half the radius.
+    Aux Space Complexity: O(V)
+    """
+    if source == target:
+        return 0
+    if reverse is None:
+        reverse = graph.reverse()
+    V = graph.num_vertices
+
+    dist_f = [INF] * V
+    dist_b = [INF] * V
+    dist_f[source] = 0
+    dist_b[target] = 0
+    heap_f = IndexedMinHeap(V, arity)
+    heap_b = IndexedMinHeap(V, arity)
+    heap_f.push(source, 0)
+    heap_b.push(target, 0)
+
+    mu = INF
+    while heap_f and heap_b:
+        top_f = heap_f.key(heap_f.peek())
+        top_b = heap_b.key(heap_b.peek())
+        if top_f + top_b >= mu:
+            break
+
+        # Expand the side with the smaller tentative distance
+        if top_f <= top_b:
+            heap, side, dist, other = heap_f, graph, dist_f, dist_b
+        else:
+            heap, side, dist, other = heap_b, reverse, dist_b, dist_f
+        offsets, targets, weights = side.offsets, side.targets, side.weights
+
+        u = heap.pop()
+        d = dist[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            new_dist = d + weights[e]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                heap.push_or_decrease(v, new_dist)
+            # Path through the edge (u, v) meets the other search at v
+            if new_dist + other[v] < mu:
+                mu = new_dist + other[v]
+
+    return mu
+
 
 if __name__ == '__main__':
-    pass
\ No newline at end of file
+    edges = [
+        (0, 1, 4),
+        (0, 2, 1),
+        (2, 1, 2),
+        (1, 3, 1),
+        (2, 3, 5),
+        (3, 4, 3)
+    ]
+    # Node 5 is unreachable
+    graph = CSRGraph.from_edges(edges, num_vertices=6)
+
+    res = dijkstra(graph, 0)
+    exp = [0, 3, 1, 4, 7, -1]
+    assert res == exp, f'Expected {exp}, got {res}'
+    assert dijkstra(edges, 0) == exp[:5]
+
+    # Early exit at the target
+    assert dijkstra(graph, 0, target=3)[3] == 4
+
+    # Every queue strategy gives the same distances
+    for queue in ('heap', 'bucket', 'radix'):
+        res = dijkstra(graph, 0, queue=queue)
+        assert res == [0, 3, 1, 4, 7, -1], f'Wrong distances with the {queue} queue'
+
+    # 'auto' only picks the bucket queue when C is small next to the graph
+    assert choose_queue(graph) == 'bucket'
+    assert choose_queue(CSRGraph.from_edges([(0, 1, 60000), (1, 2, 1)], num_vertices=3)) == 'radix'
+    assert choose_queue(CSRGraph.from_edges([(0, 1, 0.5)], num_vertices=2)) == 'heap'
+
+    # Bidirectional search agrees with the one-directional search
+    reverse = graph.reverse()
+    for t in range(6):
+        res = bidirectional_dijkstra(graph, 0, t, reverse)
+        exp = dijkstra_distances(graph, 0)[t]
+        assert res == exp, f'Expected {exp} to node {t}, got {res}'
+
+    print('All tests passed')
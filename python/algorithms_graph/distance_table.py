@@ -0,0 +1,149 @@
+"""
+? Name
+Many-to-many Distance Table
+
+? Description
+Given a graph, a list of sources and a list of targets, compute the matrix of
+shortest distances table[i][j] = d(sources[i], targets[j]).
+
+Instead of calling a single-pair query in a loop (which rebuilds the graph and
+reallocates every buffer per pair), the graph is built once and one Dijkstra
+is run per source:
+
+- The distance list and the indexed heap are allocated once and reused. Only
+  the nodes touched by the previous search are reset, so a search that stays
+  local does not pay O(V) to clean up.
+- Each search stops as soon as every target has been settled.
+- The result is a flat row-major array('d') (INF for unreachable pairs), or a
+  2D NumPy array when NumPy is available.
+"""
+import os
+import sys
+from array import array
+from typing import List, Optional, Sequence, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+from data_structures.IndexedMinHeap import IndexedMinHeap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INF = float('inf')
+
+def distance_table(
+    graph: Union[CSRGraph, List],
+    sources: Sequence[int],
+    targets: Sequence[int],
+    use_numpy: Optional[bool] = None,
+    arity: int = 4
+):
+    """
+    Shortest distances from every source to every target
+
+    Args:
+        graph: Directed graph with non-negative weights (CSRGraph or a list of
+            (u, v, w) edges).
+        sources: Source nodes (rows).
+        targets: Target nodes (columns).
+        use_numpy: True for a NumPy (S, T) array, False for a flat array('d').
+            Defaults to NumPy when it is installed.
+        arity: Arity of the indexed heap.
+
+    Returns:
+        The S x T distance matrix, row-major, with INF for unreachable pairs.
+
+    Time Complexity: O(S * E log V) worst case; each search stops once all
+        targets are settled.
+    Aux Space Complexity: O(V + S * T)
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ImportError('NumPy is not installed')
+
+    graph = as_csr(graph)
+    V = graph.num_vertices
+    offsets, targets_, weights = graph.offsets, graph.targets, graph.weights
+
+    T = len(targets)
+    table = array('d', [INF]) * (len(sources) * T)
+
+    # Distinct targets, so the search knows when it can stop
+    is_target = bytearray(V)
+    for t in targets:
+        is_target[t] = 1
+    num_distinct = sum(is_target)
+
+    # Scratch buffers shared by every search
+    dist = [INF] * V
+    heap = IndexedMinHeap(V, arity)
+    touched: List[int] = []
+
+    for row, s in enumerate(sources):
+        dist[s] = 0
+        touched.append(s)
+        heap.push(s, 0)
+        remaining = num_distinct
+
+        while heap:
+            u = heap.pop()
+            if is_target[u]:
+                remaining -= 1
+                if remaining == 0:
+                    break
+
+            d = dist[u]
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets_[e]
+                new_dist = d + weights[e]
+                if new_dist < dist[v]:
+                    if dist[v] == INF:
+                        touched.append(v)
+                    dist[v] = new_dist
+                    heap.push_or_decrease(v, new_dist)
+
+        base = row * T
+        for j in range(T):
+            table[base + j] = dist[targets[j]]
+
+        # Reset only what this search touched
+        heap.clear()
+        for v in touched:
+            dist[v] = INF
+        touched.clear()
+
+    if use_numpy:
+        return np.frombuffer(table, dtype=np.float64).reshape(len(sources), T).copy()
+    return table
+
+
+if __name__ == '__main__':
+    from algorithms_graph.dijkstra import dijkstra_distances
+
+    edges = [
+        (0, 1, 4),
+        (0, 2, 1),
+        (2, 1, 2),
+        (1, 3, 1),
+        (2, 3, 5),
+        (3, 4, 3)
+    ]
+    graph = CSRGraph.from_edges(edges, num_vertices=6)
+    sources = [0, 2, 3, 5]
+    targets = [4, 1, 3, 0]
+
+    table = distance_table(graph, sources, targets, use_numpy=False)
+    for i, s in enumerate(sources):
+        exp = dijkstra_distances(graph, s)
+        for j, t in enumerate(targets):
+            assert table[i * len(targets) + j] == exp[t], f'Wrong distance from {s} to {t}'
+
+    if np is not None:
+        matrix = distance_table(graph, sources, targets)
+        assert matrix.shape == (4, 4)
+        assert matrix.tolist() == [list(table[i * 4:(i + 1) * 4]) for i in range(4)]
+
+    print('All tests passed')
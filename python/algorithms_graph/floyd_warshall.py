@@ -1,4 +1,15 @@
-from typing import List, Tuple
+import os
+import sys
+from multiprocessing import Pool, shared_memory
+from typing import Iterator, List, Optional, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 Weight = int
 Node = int
@@ -6,29 +17,31 @@ Edge = Tuple[Weight, Node, Node]
 
 INF = float('inf')
 
-def floyd_warshall(edges: List[Edge]):
+# Up to this many vertices the NumPy version runs plain k-steps over the whole
+# matrix, above it the three-phase blocked update
+BLOCKED_MIN_VERTICES = 512
+DEFAULT_BLOCK_SIZE = 64
+# Larger blocks with several workers, so there are fewer phases to synchronise
+PARALLEL_BLOCK_SIZE = 256
+
+def floyd_warshall(edges: Union[List[Edge], CSRGraph]):
     """
     Floyd Warshall All Pairs Shortest Path
     
     Time Complexity: O(V^3)
     Space Complexity (auxiliary): O(V^2)
     """
-    # Find the maximum vertex
-    V = 0
-    for edge in edges:
-        V = max(V, edge[1], edge[2])
-    # No of vertices = max node + 1
-    V += 1
+    # Build the CSR graph once (or reuse the one passed in)
+    graph = as_csr(edges, weight_first=True)
+    V = graph.num_vertices
     
     # The shortest distance matrix 
     dist: List[List[int]] = [[INF] * V for _ in range(V)]
     
     for v in range(V):
         dist[v][v] = 0
-        
-    print(dist)
     
-    for w, u, v in edges:
+    for u, v, w in graph.edges():
         dist[u][v] = min(dist[u][v], w)
         
     for k in range(V): # Intermediate vertex
@@ -38,6 +51,203 @@ def floyd_warshall(edges: List[Edge]):
                 
     return dist
     
+def floyd_warshall_numpy(
+    edges: Union[List[Edge], CSRGraph],
+    block_size: Optional[int] = None,
+    predecessors: bool = False,
+    workers: int = 1
+):
+    """
+    Floyd Warshall on a contiguous float64 NumPy matrix
+    
+    Every k-step is the vectorized update
+        D = min(D, D[:, k, None] + D[None, k, :])
+    
+    For V > BLOCKED_MIN_VERTICES the matrix is processed in blocks of
+    `block_size` intermediate vertices K, in three phases per block:
+        1. The diagonal block D[K, K] with k in K.
+        2. The rest of the row panel D[K, :] and of the column panel D[:, K],
+        which only read the (now final) diagonal block and themselves.
+        3. Every other strip of rows D[I, :], which only reads the final
+        panels D[I, K] and D[K, :].
+    A strip of rows is small enough to stay in cache for all k in K, instead
+    of streaming the whole V x V matrix through memory for every k.
+    
+    The tiles within phase 2, and within phase 3, write disjoint parts of the
+    matrix and only read final parts, so with `workers` > 1 they run on a
+    process pool. The matrix then lives in multiprocessing.shared_memory and
+    every worker attaches to it once by name, so a task is just the bounds of
+    its tile.
+    
+    Args:
+        edges: A list of edges (weight, u, v), or a CSRGraph.
+        block_size: Intermediate vertices per block. Defaults to a plain
+            k-loop for small graphs and DEFAULT_BLOCK_SIZE otherwise (or
+            PARALLEL_BLOCK_SIZE with several workers).
+        predecessors: Also return the predecessor matrix. Always uses the
+            plain k-loop in this process.
+        workers: Number of worker processes for the blocked phases.
+    
+    Returns:
+        dist, a (V, V) float64 array (INF where there is no path), or
+        (dist, pred) if `predecessors`, where pred[u, v] is the node before v
+        on a shortest path from u to v, or -1 (see reconstruct_path).
+        A negative dist[v, v] means v lies on a negative cycle.
+    
+    Time Complexity: O(V^3), as V vectorized k-steps (split over the workers)
+    Space Complexity (auxiliary): O(V^2)
+    """
+    if np is None:
+        raise ImportError('NumPy is not installed')
+    if workers < 1:
+        raise ValueError('workers must be at least 1')
+    if predecessors and workers > 1:
+        raise ValueError('The predecessor matrix is only computed with workers=1')
+    
+    graph = as_csr(edges, weight_first=True)
+    V = graph.num_vertices
+    
+    if block_size is None:
+        if V <= BLOCKED_MIN_VERTICES:
+            block_size = max(V, 1)
+        else:
+            block_size = PARALLEL_BLOCK_SIZE if workers > 1 else DEFAULT_BLOCK_SIZE
+    if predecessors:
+        # The blocked phases reach equal distances in a different order, which
+        # can leave a zero-weight cycle in pred, so keep the plain k order
+        block_size = max(V, 1)
+    parallel = workers > 1 and block_size < V
+    
+    # Everything after creating the shared segment is inside the try, so a
+    # failure anywhere still unlinks it
+    shm = None
+    try:
+        if parallel:
+            shm = shared_memory.SharedMemory(create=True, size=V * V * 8)
+            dist = np.ndarray((V, V), dtype=np.float64, buffer=shm.buf)
+            dist.fill(np.inf)
+        else:
+            dist = np.full((V, V), np.inf)
+        
+        src = np.repeat(np.arange(V), np.diff(np.frombuffer(graph.offsets, dtype=np.int32)))
+        dst = np.frombuffer(graph.targets, dtype=np.int32)
+        w = np.array(graph.weights, dtype=np.float64)
+        # Parallel edges keep the lightest one
+        np.minimum.at(dist, (src, dst), w)
+        
+        pred = None
+        if predecessors:
+            pred = np.full((V, V), -1, dtype=np.int32)
+            has_edge = np.isfinite(dist)
+            pred[has_edge] = np.nonzero(has_edge)[0]
+        
+        diagonal = np.arange(V)
+        dist[diagonal, diagonal] = np.minimum(dist[diagonal, diagonal], 0)
+        if pred is not None:
+            pred[diagonal, diagonal] = -1
+        
+        if not parallel:
+            for tiles in _blocked_phases(V, block_size):
+                for tile in tiles:
+                    _relax_tile(dist, pred, tile)
+            if predecessors:
+                return dist, pred
+            return dist
+        
+        with Pool(workers, initializer=_attach_shared, initargs=(shm.name, V)) as pool:
+            for tiles in _blocked_phases(V, block_size):
+                if len(tiles) == 1:
+                    _relax_tile(dist, None, tiles[0])
+                else:
+                    pool.map(_relax_shared, tiles)
+        return dist.copy()
+    finally:
+        if shm is not None:
+            # The segment cannot be closed while dist still views it
+            dist = None
+            shm.close()
+            shm.unlink()
+
+Tile = Tuple[int, int, int, int, int, int]
+
+def _blocked_phases(V: int, block_size: int) -> Iterator[List[Tile]]:
+    """
+    Yields the tiles of every phase in order. The tiles of one phase are
+    independent of each other.
+    
+    A tile (r0, r1, c0, c1, k0, k1) relaxes dist[r0:r1, c0:c1] through the
+    intermediate vertices k0..k1-1.
+    """
+    if block_size >= V:
+        # Single block: plain k-steps over the whole matrix
+        yield [(0, V, 0, V, 0, V)]
+        return
+    
+    for k0 in range(0, V, block_size):
+        k1 = min(k0 + block_size, V)
+        others = [(i, min(i + block_size, V)) for i in range(0, V, block_size) if i != k0]
+        
+        # Phase 1: diagonal block
+        yield [(k0, k1, k0, k1, k0, k1)]
+        # Phase 2: row and column panels, without the diagonal block
+        yield [(k0, k1, c0, c1, k0, k1) for c0, c1 in others] \
+            + [(r0, r1, k0, k1, k0, k1) for r0, r1 in others]
+        # Phase 3: the other strips of rows
+        yield [(r0, r1, 0, V, k0, k1) for r0, r1 in others]
+
+def _relax_tile(dist, pred, tile: Tile) -> None:
+    r0, r1, c0, c1, k0, k1 = tile
+    _relax(dist, pred, slice(r0, r1), slice(c0, c1), range(k0, k1))
+
+# Shared distance matrix of a worker process, attached once by _attach_shared
+_shared = None
+_shared_dist = None
+
+def _attach_shared(name: str, V: int) -> None:
+    global _shared, _shared_dist
+    _shared = shared_memory.SharedMemory(name=name)
+    _shared_dist = np.ndarray((V, V), dtype=np.float64, buffer=_shared.buf)
+
+def _relax_shared(tile: Tile) -> None:
+    _relax_tile(_shared_dist, None, tile)
+
+def _relax(dist, pred, rows: slice, cols: slice, ks: range) -> None:
+    """For every k in ks: dist[rows, cols] = min(dist[rows, cols], dist[rows, k] + dist[k, cols])"""
+    block = dist[rows, cols]
+    if pred is None:
+        # One scratch buffer for every k instead of a fresh temporary
+        candidate = np.empty_like(block)
+        for k in ks:
+            np.add(dist[rows, k, None], dist[None, k, cols], out=candidate)
+            np.minimum(block, candidate, out=block)
+        return
+    
+    pred_block = pred[rows, cols]
+    for k in ks:
+        candidate = dist[rows, k, None] + dist[None, k, cols]
+        better = candidate < block
+        block[better] = candidate[better]
+        # The node before v on u -> k -> v is the node before v on k -> v
+        pred_block[better] = np.broadcast_to(pred[k, cols], block.shape)[better]
+
+def reconstruct_path(pred, u: Node, v: Node) -> List[Node]:
+    """
+    Shortest path from u to v from a predecessor matrix
+
+    Returns:
+        The nodes u .. v, or [] if there is no path.
+    """
+    if u == v:
+        return [u]
+    if pred[u][v] == -1:
+        return []
+    path = [v]
+    while v != u:
+        v = int(pred[u][v])
+        path.append(v)
+    path.reverse()
+    return path
+    
 if __name__ == '__main__':
     edges = [
         (3, 0, 1),
@@ -62,4 +272,15 @@ if __name__ == '__main__':
             if distance == INF:
                 print(f'Shortest path from node {u} to {v} has no path')
             else: 
-                print(f'Shortest path from node {u} to {v} has distance {distance}')
\ No newline at end of file
+                print(f'Shortest path from node {u} to {v} has distance {distance}')
+    
+    # The NumPy versions (plain and blocked) agree with the pure Python one
+    if np is not None:
+        assert floyd_warshall_numpy(edges).tolist() == shortest_paths
+        assert floyd_warshall_numpy(edges, block_size=2).tolist() == shortest_paths
+        assert floyd_warshall_numpy(edges, block_size=2, workers=2).tolist() == shortest_paths
+        
+        dist, pred = floyd_warshall_numpy(edges, predecessors=True)
+        assert dist.tolist() == shortest_paths
+        path = reconstruct_path(pred, 3, 0)
+        assert path == [3, 1, 2, 0], f'Unexpected path {path}'
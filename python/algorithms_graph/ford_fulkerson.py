@@ -1,115 +1,293 @@
 import sys
 import os
-from typing import List, Optional, Tuple
+import math
+from collections import deque
+from typing import List, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.residual_graph import ResidualGraph, as_residual
+from algorithms_graph.push_relabel import push_relabel
 
-class Edge:
-    def __init__(self, to: int, capacity: int):
-        self.to = to
-        self.capacity = capacity
-        self.flow = 0
-        self.reverse: Optional[Edge] = None
-        
-Graph = List[List[Edge]]
 INFINITY = float('inf')
 
-def _build_graph(num_vertices: int, edges: List[Tuple[int, int, int]]) -> Graph:
-    """Builds the residual graph structure with forward and backward edges"""
-    graph: Graph = [[] for _ in range(num_vertices)]
-    for u, v, capacity in edges:
-        # Create forward edge
-        forward_edge = Edge(to=v, capacity=capacity)
-        # Create backward edge (capacity 0, flow will be negative of forward)
-        backward_edge = Edge(to=u, capacity=0)
+# Max-flow algorithms selectable in ford_fulkerson
+ALGORITHMS = ('dfs', 'scaling', 'dinic', 'push_relabel')
+
+def _min_residual(graph: ResidualGraph):
+    """
+    Smallest residual worth pushing: 1 for integral capacities, otherwise the
+    smallest positive float, so residual >= it is the same as residual > 0
+    """
+    return 1 if graph.capacity.typecode == 'q' else math.ulp(0.0)
+
+def _augment_round(
+    graph: ResidualGraph,
+    s: int,
+    t: int,
+    delta,
+    visited: List[bool],
+    current: List[int]
+) -> float:
+    """
+    One DFS traversal from s that augments every path to t it comes across,
+    only following arcs with residual capacity >= delta.
+    
+    The search keeps an explicit stack instead of recursing, so the path
+    length is not bounded by the recursion limit. current[u] is the next arc
+    of u to try: when the search backtracks to u it resumes from there instead
+    of rescanning u's arcs. After an augmentation it retreats only to the tail
+    of the first arc that dropped below delta and carries on from there.
+    
+    A vertex the search backtracks from stays visited for the rest of the
+    round, so a round may miss a path; ford_fulkerson stops only after a
+    whole round finds nothing.
+    
+    Returns:
+        The total flow augmented in this round
+    """
+    head, capacity, flow, nxt = graph.head, graph.capacity, graph.flow, graph.next
+    for v in range(len(visited)):
+        visited[v] = False
+        current[v] = graph.first[v]
+    
+    total = 0
+    visited[s] = True
+    # stack[i] is the tail of arcs[i], stack[i + 1] its head
+    stack = [s]
+    arcs: List[int] = []
+    while stack:
+        u = stack[-1]
+        if u == t:
+            # k: the first arc with the smallest residual capacity
+            k = 0
+            bottleneck = capacity[arcs[0]] - flow[arcs[0]]
+            for i in range(1, len(arcs)):
+                residual_capacity = capacity[arcs[i]] - flow[arcs[i]]
+                if residual_capacity < bottleneck:
+                    k, bottleneck = i, residual_capacity
+            for e in arcs:
+                flow[e] += bottleneck
+                flow[e ^ 1] -= bottleneck
+            total += bottleneck
+            
+            # Retreat to the tail of the first arc that can no longer carry
+            # delta (at the latest the saturated arc k), the path up to it
+            # may still carry flow
+            for i in range(k):
+                if capacity[arcs[i]] - flow[arcs[i]] < delta:
+                    k = i
+                    break
+            for v in stack[k + 1:]:
+                visited[v] = False
+            del stack[k + 1:]
+            del arcs[k:]
+            continue
         
-        # Link the edges
-        forward_edge.reverse = backward_edge
-        backward_edge.reverse = forward_edge
+        # Advance u's arc pointer to the next usable arc
+        e = current[u]
+        while e != -1 and (capacity[e] - flow[e] < delta or visited[head[e]]):
+            e = nxt[e]
+        current[u] = e
         
-        # Add edges to the adjacency list
-        graph[u].append(forward_edge)
-        graph[v].append(backward_edge)
-    return graph
+        if e == -1:
+            # Dead end: backtrack, u stays visited
+            stack.pop()
+            if arcs:
+                arcs.pop()
+        else:
+            v = head[e]
+            visited[v] = True
+            stack.append(v)
+            arcs.append(e)
+    
+    return total
 
-def _dfs(u: int, t: int, bottleneck: float, graph: Graph, visited: List[bool]) -> float:
+def _augmenting_paths(graph: ResidualGraph, s: int, t: int, scaling: bool) -> float:
     """
-    Performs DFS to find an augmenting path and augments flow simultaneously.
+    Ford-Fulkerson: augment along DFS paths until none is left.
     
-    Args:
-        u: Current vertex.
-        t: Target (sink) vertex.
-        bottleneck: The maximum flow that can be pushed through the path found so far.
-        graph: The residual graph (adjacency list).
-        visited: List to keep track of visited nodes in the current DFS traversal.
-        
-    Returns:
-        The amount of flow augmented by the path found (0 if no path found from u)
+    With `scaling`, only arcs with residual capacity >= delta are used, for
+    delta = the largest power of two <= the largest capacity, halved every
+    time no such path is left. Each delta phase augments O(E) paths, so it
+    takes O(E^2 log U) for largest capacity U instead of O(E * f).
     """
-    # Base case: Reached the sink
-    if u == t:
-        return bottleneck
+    V = graph.num_vertices
+    visited = [False] * V
+    current = [-1] * V
+    smallest = _min_residual(graph)
+    
+    deltas = [smallest]
+    if scaling:
+        largest = max(graph.capacity[0::2], default=0)
+        delta = 1
+        while delta * 2 <= largest:
+            delta *= 2
+        deltas = []
+        while delta >= 1:
+            deltas.append(delta)
+            delta //= 2
+        if smallest < 1:
+            deltas.append(smallest)
     
-    visited[u] = True
+    max_flow = 0.0
+    for delta in deltas:
+        while True:
+            augmented_flow = _augment_round(graph, s, t, delta, visited, current)
+            # If no augmenting path was found, move on to the next delta
+            if augmented_flow == 0:
+                break
+            max_flow += augmented_flow
+    return max_flow
+
+def _bfs_levels(s: int, t: int, graph: ResidualGraph, level: List[int]) -> bool:
+    """
+    Builds the level graph: level[v] is the BFS distance from s to v using
+    arcs with residual capacity (-1 if unreachable).
+    
+    Returns:
+        True if t is reachable, i.e. there is still an augmenting path
+    """
+    head, capacity, flow, nxt, first = graph.head, graph.capacity, graph.flow, graph.next, graph.first
+    for i in range(len(level)):
+        level[i] = -1
+    level[s] = 0
+    queue = deque([s])
+    while queue:
+        u = queue.popleft()
+        e = first[u]
+        while e != -1:
+            v = head[e]
+            if capacity[e] - flow[e] > 0 and level[v] == -1:
+                level[v] = level[u] + 1
+                queue.append(v)
+            e = nxt[e]
+    return level[t] != -1
 
-    # Explore neighbours
-    for edge in graph[u]:
-        residual_capacity = edge.capacity - edge.flow
-        v = edge.to
+def _blocking_flow(s: int, t: int, graph: ResidualGraph, level: List[int], current: List[int]) -> float:
+    """
+    Augments along paths of the level graph until none is left (a blocking
+    flow).
+    
+    Only arcs going exactly one level down are followed. current[u] is the
+    first arc of u that may still be useful in this phase; an arc that leads
+    to a dead end is skipped for the rest of the phase, so every arc is
+    discarded at most once per phase.
+    
+    The search keeps an explicit stack of vertices instead of recursing, and
+    current[u] of every vertex u on it is the arc to the next one. After an
+    augmentation it retreats only to the tail of the saturated arc.
+    
+    Returns:
+        The total flow augmented
+    """
+    head, capacity, flow, nxt = graph.head, graph.capacity, graph.flow, graph.next
+    total = 0.0
+    stack = [s]
+    while stack:
+        u = stack[-1]
+        if u == t:
+            # k: the first arc on the path with the smallest residual capacity
+            k = 0
+            e = current[s]
+            bottleneck = capacity[e] - flow[e]
+            for i in range(1, len(stack) - 1):
+                e = current[stack[i]]
+                if capacity[e] - flow[e] < bottleneck:
+                    k, bottleneck = i, capacity[e] - flow[e]
+            for i in range(len(stack) - 1):
+                e = current[stack[i]]
+                flow[e] += bottleneck
+                flow[e ^ 1] -= bottleneck
+            total += bottleneck
+            # Keep the arcs before k, they may still have residual capacity
+            del stack[k + 1:]
+            continue
         
-        # Check if we can push flow and haven't visited the neighbour yet
-        if residual_capacity > 0 and not visited[v]:
-            # Recursively call DFS on the neighbour
-            # The new bottleneck is the minimum of the current bottleneck and the residual capacity
-            augment = _dfs(v, t, min(bottleneck, residual_capacity), graph, visited)
-            
-            # If we found an augmenting path from the neighbour (augment > 0)
-            if augment > 0:
-                # Augment the flow on the current edge
-                edge.flow += augment
+        # Advance u's arc pointer to the next arc one level down
+        next_level = level[u] + 1
+        e = current[u]
+        while e != -1 and (capacity[e] - flow[e] <= 0 or level[head[e]] != next_level):
+            e = nxt[e]
+        current[u] = e
+        
+        if e == -1:
+            # Dead end: drop the arc into u for the rest of the phase
+            stack.pop()
+            if stack:
+                parent = stack[-1]
+                current[parent] = nxt[current[parent]]
+        else:
+            stack.append(head[e])
+    
+    return total
 
-                # Decrease the flow on the reverse edge (maintaining invariant)
-                # Ensure reverse edge exists before acccessing its flow
-                if edge.reverse:
-                    edge.reverse.flow -= augment
-                else:
-                    # This case should ideally not happen if graph is built correctly
-                    print(f'Warning: Reverse edge not found for edge to {edge.to} from {u}')
-                    
-                return augment # Return the augmented flow
-    
-    # No augmenting path found from this vertex u
-    return 0 
+def _dinic(graph: ResidualGraph, s: int, t: int) -> float:
+    """
+    Dinic's algorithm: alternate a BFS that builds the level graph with a
+    blocking flow in it (augmenting paths until none is left), using per-node
+    current-arc pointers.
+    
+    Time Complexity: O(V^2 * E), O(E * sqrt(V)) on unit-capacity bipartite
+        networks. Independent of the flow value.
+    """
+    max_flow = 0.0
+    level = [-1] * graph.num_vertices
+    
+    while _bfs_levels(s, t, graph, level):
+        current = list(graph.first)
+        max_flow += _blocking_flow(s, t, graph, level, current)
+    
+    return max_flow
 
-def ford_fulkerson(num_vertices: int, edges: List[Tuple[int, int, int]], s: int, t: int) -> float:
+def ford_fulkerson(
+    num_vertices: int,
+    edges: Union[List[Tuple[int, int, int]], ResidualGraph],
+    s: int,
+    t: int,
+    algorithm: str = 'dfs'
+) -> float:
     """
-    Calculates the maximum flow from source s to sink t using Ford-Fulkerson with DFS
+    Calculates the maximum flow from source s to sink t
     
     Args:
         num_vertices: The total number of vertices in the graph (labeled 0 to n-1)
-        edges: A list of tuples representing directed edges: (u, v, capacity)
+        edges: A list of tuples representing directed edges: (u, v, capacity),
+            or a ResidualGraph. A ResidualGraph is augmented in place, starting
+            from the flow it already carries, and the flow on every edge can
+            be read back with graph.edge_flows().
         s: The source vertex index
         t: The sink (target) vertex index
+        algorithm: One of:
+            - 'dfs': Ford-Fulkerson with non-recursive DFS augmenting paths,
+              O(E * f) for max flow f
+            - 'scaling': the same with capacity scaling, O(E^2 log U) for
+              largest capacity U
+            - 'dinic': Dinic's blocking flows on BFS level graphs, O(V^2 * E)
+            - 'push_relabel': highest-label push-relabel with global
+              relabeling and the gap heuristic (see push_relabel). For an
+              edge list only phase one runs, a ResidualGraph also gets phase
+              two so that it is left holding a valid flow
         
     Returns:
-        The maximum flow value from s to t
+        The maximum flow value from s to t (for a ResidualGraph, the flow
+        added on top of the flow it already carried)
     """
-    graph = _build_graph(num_vertices, edges)
-    max_flow = 0.0
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f'Unknown algorithm {algorithm!r}, expected one of {ALGORITHMS}')
+    if algorithm == 'push_relabel':
+        # Phase one already gives the max flow value, phase two is only needed
+        # to turn the preflow into a flow the caller can read back
+        min_cut_only = not isinstance(edges, ResidualGraph)
+        return float(push_relabel(num_vertices, edges, s, t, min_cut_only)[0])
     
-    while True:
-        # Reset visited array for each new DFS path search
-        visited = [False] * num_vertices
-
-        # Try to find an augmenting path from s to t with infinite inital bottleneck
-        augmented_flow = _dfs(s, t, INFINITY, graph, visited)
-        
-        # If no augmenting path was found, we are done
-        if augmented_flow == 0:
-            break
-        
-        # Add the flow found in this path to the total max flow
-        max_flow += augmented_flow
-        
-    return max_flow
+    graph = as_residual(edges, num_vertices)
+    if s == t:
+        # No s-t path can be augmented
+        return 0.0
+    if algorithm == 'dinic':
+        return _dinic(graph, s, t)
+    
+    return _augmenting_paths(graph, s, t, scaling=algorithm == 'scaling')
         
         
 if __name__ == '__main__':
@@ -169,4 +347,27 @@ if __name__ == '__main__':
     print(f'Source: {source}, Sink: {sink}')
     print(f'Maximum Flow: {max_flow}')    
     
+    
+    # Dinic gives the same maximum flow on every example
+    assert ford_fulkerson(n, edges, source, sink, algorithm='dinic') == max_flow
+    assert ford_fulkerson(n, edges, source, sink, algorithm='push_relabel') == max_flow
+    assert ford_fulkerson(4, [(0, 1, 20), (0, 2, 10), (1, 2, 30), (1, 3, 10), (2, 3, 20)], 0, 3, algorithm='dinic') == 30
+
+    # A ResidualGraph is augmented in place and keeps its flow
+    graph = ResidualGraph.from_edges(n, edges)
+    assert ford_fulkerson(n, graph, source, sink, algorithm='dinic') == max_flow
+    assert sum(f for (u, _, _), f in zip(edges, graph.edge_flows()) if u == source) == max_flow
+    assert ford_fulkerson(n, graph, source, sink) == 0
+    assert push_relabel(n, graph, source, sink)[0] == 0
+
+    # Push-relabel leaves a ResidualGraph holding a flow, not a preflow: 0 -> 1
+    # takes 10 but only 1 can leave 1
+    graph = ResidualGraph.from_edges(4, [(0, 1, 10), (1, 2, 1), (0, 3, 5), (3, 2, 2)])
+    assert ford_fulkerson(4, graph, 0, 2, algorithm='push_relabel') == 3
+    assert list(graph.edge_flows()) == [1, 1, 2, 2]
+    assert ford_fulkerson(n, edges, source, sink, algorithm='scaling') == max_flow
 
+    # The augmenting-path searches do not recurse, so a 100k-vertex chain is fine
+    chain = [(i, i + 1, 10 ** 9 - i) for i in range(100_000)]
+    for algorithm in ('dfs', 'scaling', 'dinic'):
+        assert ford_fulkerson(100_001, chain, 0, 100_000, algorithm) == 10 ** 9 - 99_999
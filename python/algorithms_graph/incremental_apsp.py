@@ -0,0 +1,212 @@
+"""
+? Name
+Incremental All Pairs Shortest Paths
+
+? Description
+Keeps the all-pairs distance matrix of a directed graph up to date while
+edges are inserted or their weights are lowered, instead of rerunning
+Floyd-Warshall after every change.
+
+When an edge u -> v gets weight w, every new shortest path uses it at most
+once, so the only candidates are
+
+    d(x, y) = d(x, u) + w + d(v, y)
+
+for the old distances d. Moreover a source x can only improve if it improves
+its distance to v (d(x, u) + w < d(x, v)) and a destination y only if u
+improves its distance to y (w + d(v, y) < d(u, y)), so the update only loops
+over those sources and destinations: O(V^2) worst case, much less when the
+change is local.
+
+Updates are queued and applied on the next read, so many updates between
+reads are batched. A batch larger than V is cheaper to apply as a full
+recomputation (Johnson's algorithm) on the updated edge set.
+"""
+import os
+import sys
+from typing import Dict, Iterable, List, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+from algorithms_graph.johnson import johnson
+
+INF = float('inf')
+
+Update = Tuple[int, int, int]
+
+class IncrementalAPSP:
+    """
+    All-pairs distance matrix under edge insertions and weight decreases
+
+    Attributes:
+        num_vertices: V, vertices are 0..V-1.
+        dist: dist[x][y] is the shortest distance from x to y (INF if none).
+            Only up to date after flush(); read it through distance() or row().
+    """
+    __slots__ = ('num_vertices', 'dist', '_weights', '_pending')
+
+    def __init__(self, num_vertices: int, edges: Union[Iterable[Update], CSRGraph] = ()):
+        """
+        Builds the initial matrix with Johnson's algorithm
+
+        Args:
+            num_vertices: V.
+            edges: Initial directed edges (u, v, w), or a CSRGraph. Weights
+                may be negative. Raises ValueError on a negative cycle.
+
+        Time Complexity: O(V * E log V)
+        """
+        if isinstance(edges, CSRGraph):
+            graph = edges
+        else:
+            graph = as_csr(list(edges), num_vertices)
+
+        # Parallel edges keep the lightest one
+        self._weights: Dict[Tuple[int, int], int] = {}
+        for u, v, w in graph.edges():
+            if w < self._weights.get((u, v), INF):
+                self._weights[(u, v)] = w
+
+        self.num_vertices = num_vertices
+        self.dist: List[List] = self._recompute(self._weights)
+        self._pending: List[Update] = []
+
+    def _recompute(self, weights: Dict[Tuple[int, int], int]) -> List[List]:
+        edges = [(w, u, v) for (u, v), w in weights.items()]
+        graph = CSRGraph.from_edges(edges, num_vertices=self.num_vertices, weight_first=True)
+        return [row for _, row in johnson(graph)]
+
+    def update(self, u: int, v: int, w) -> None:
+        """
+        Queues the insertion of u -> v with weight w (or lowering its weight to
+        w). A weight at least the current one has no effect.
+
+        Time Complexity: O(1), the work happens on the next flush
+        """
+        self._pending.append((u, v, w))
+
+    def flush(self) -> None:
+        """
+        Applies every queued update
+
+        The batch is applied atomically: if it would create a negative cycle,
+        ValueError is raised and the matrix and edges are left as they were
+        before the batch.
+
+        Time Complexity: O(k * V^2) worst case for k updates, capped at a full
+            O(V * E log V) recomputation when k > V
+        """
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
+
+        if len(pending) > self.num_vertices:
+            weights = dict(self._weights)
+            for u, v, w in pending:
+                if w < weights.get((u, v), INF):
+                    weights[(u, v)] = w
+            # Johnson raises on a negative cycle before anything is replaced
+            self.dist = self._recompute(weights)
+            self._weights = weights
+            return
+
+        # Undo logs, so a negative cycle halfway through rolls the batch back
+        changed_cells: List[Tuple[int, int, int]] = []
+        changed_edges: List[Tuple[Tuple[int, int], int]] = []
+        try:
+            for u, v, w in pending:
+                old = self._weights.get((u, v), INF)
+                if w >= old:
+                    continue
+                self._apply(u, v, w, changed_cells)
+                changed_edges.append(((u, v), old))
+                self._weights[(u, v)] = w
+        except ValueError:
+            dist = self.dist
+            for x, y, d in reversed(changed_cells):
+                dist[x][y] = d
+            for edge, old in reversed(changed_edges):
+                if old == INF:
+                    del self._weights[edge]
+                else:
+                    self._weights[edge] = old
+            raise
+
+    def _apply(self, u: int, v: int, w, log: List[Tuple[int, int, int]]) -> None:
+        """Relaxes every pair through the edge u -> v of weight w. O(V^2)"""
+        dist = self.dist
+        V = self.num_vertices
+        if dist[v][u] + w < 0:
+            raise ValueError(f'Edge ({u}, {v}) with weight {w} creates a negative-weight cycle')
+
+        # Sources whose distance to v improves, destinations that u gets closer to
+        sources = [x for x in range(V) if dist[x][u] + w < dist[x][v]]
+        if not sources:
+            return
+        row_v, row_u = dist[v], dist[u]
+        destinations = [(y, w + row_v[y]) for y in range(V) if w + row_v[y] < row_u[y]]
+
+        for x in sources:
+            row_x = dist[x]
+            to_u = row_x[u]
+            for y, via in destinations:
+                candidate = to_u + via
+                if candidate < row_x[y]:
+                    log.append((x, y, row_x[y]))
+                    row_x[y] = candidate
+
+    def distance(self, u: int, v: int):
+        """Shortest distance from u to v after all queued updates"""
+        self.flush()
+        return self.dist[u][v]
+
+    def row(self, u: int) -> List:
+        """Shortest distances from u to every vertex after all queued updates"""
+        self.flush()
+        return self.dist[u]
+
+
+if __name__ == '__main__':
+    import random
+    from algorithms_graph.floyd_warshall import floyd_warshall
+
+    edges = [(0, 1, 4), (1, 2, 3), (2, 3, 2), (3, 0, 1)]
+    apsp = IncrementalAPSP(5, edges)
+    assert apsp.distance(0, 3) == 9
+    assert apsp.distance(0, 4) == INF
+
+    apsp.update(0, 2, 1)
+    assert apsp.distance(0, 3) == 3
+    assert apsp.distance(1, 3) == 5
+
+    # A heavier parallel edge changes nothing
+    apsp.update(0, 2, 10)
+    assert apsp.distance(0, 2) == 1
+
+    # A negative cycle rejects the whole batch
+    apsp.update(3, 4, 1)
+    apsp.update(2, 0, -4)
+    try:
+        apsp.flush()
+        assert False, 'Expected a negative cycle'
+    except ValueError:
+        pass
+    assert apsp.distance(3, 4) == INF and apsp.distance(2, 0) == 3
+
+    # Random updates agree with recomputing from scratch, one at a time and
+    # in batches (small ones and ones that trigger a full recomputation)
+    rng = random.Random(3)
+    V = 12
+    current = {}
+    apsp = IncrementalAPSP(V)
+    for batch in (1, 1, 1, 4, 20, 3, 30):
+        for _ in range(batch):
+            u, v, w = rng.randrange(V), rng.randrange(V), rng.randint(0, 20)
+            apsp.update(u, v, w)
+            current[(u, v)] = min(w, current.get((u, v), INF))
+        exp = floyd_warshall([(w, u, v) for (u, v), w in current.items()] + [(0, V - 1, V - 1)])
+        for x in range(V):
+            assert apsp.row(x) == exp[x], f'Row {x}: expected {exp[x]}, got {apsp.row(x)}'
+
+    print('All tests passed')
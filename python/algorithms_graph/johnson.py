@@ -0,0 +1,139 @@
+"""
+? Name
+Johnson's All Pairs Shortest Paths
+
+? Description
+All-pairs shortest paths on a sparse directed graph whose edges may be
+negative (but with no negative cycle), in O(V * E log V) instead of the
+Theta(V^3) of Floyd-Warshall.
+
+1. Add a virtual source q with a 0-weight edge to every node and run
+   Bellman-Ford from q once. h[v] = d(q, v) is a potential: for every edge
+   u -> v, h[v] <= h[u] + w(u, v).
+2. Reweight every edge as w'(u, v) = w(u, v) + h[u] - h[v] >= 0. Along any
+   path from s to t the potentials telescope, so w'(path) = w(path) + h[s] - h[t]
+   and shortest paths stay shortest.
+3. Run Dijkstra from every node on the reweighted CSR graph and undo the
+   reweighting: d(s, t) = d'(s, t) - h[s] + h[t].
+
+The rows are yielded one source at a time, so a caller that only aggregates
+per row never holds the V x V matrix.
+"""
+import os
+import sys
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+from algorithms_graph.bellman_ford import bellman_ford
+from algorithms_graph.dijkstra import dijkstra_distances
+
+Weight = int
+Node = int
+Edge = Tuple[Weight, Node, Node]
+
+INF = float('inf')
+
+def johnson_potentials(graph: CSRGraph) -> List:
+    """
+    Potentials h from one Bellman-Ford run out of a virtual source
+
+    Returns:
+        h where h[v] is the shortest distance to v from a virtual node with a
+        0-weight edge to every node (so h[v] <= 0).
+        Raises ValueError if the graph has a negative cycle.
+
+    Time Complexity: O(V * E) worst case
+    """
+    V = graph.num_vertices
+    virtual = list(graph.edges())
+    virtual.extend((V, v, 0) for v in range(V))
+    augmented = CSRGraph.from_edges(virtual, num_vertices=V + 1)
+
+    h, _ = bellman_ford(augmented, V)
+    return h[:V]
+
+def reweight(graph: CSRGraph, h: List) -> CSRGraph:
+    """
+    The graph with every weight w(u, v) replaced by w + h[u] - h[v]
+
+    The offsets and targets buffers are shared with `graph`, only the weights
+    are new.
+
+    Time Complexity: O(V + E)
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    new_weights = array(weights.typecode, weights)
+    for u in range(graph.num_vertices):
+        hu = h[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            new_weights[e] += hu - h[targets[e]]
+    return CSRGraph(graph.num_vertices, offsets, targets, new_weights)
+
+def johnson(
+    edges: Union[List[Edge], CSRGraph],
+    sources: Optional[Iterable[Node]] = None,
+    arity: int = 4
+) -> Iterator[Tuple[Node, List]]:
+    """
+    Johnson's all pairs shortest paths, streamed row by row
+
+    Args:
+        edges: A list of edges (weight, u, v), or a CSRGraph. Weights may be
+            negative.
+        sources: Optional. Only yield the rows of these nodes (all by default).
+        arity: Arity of the indexed heap used by Dijkstra.
+
+    Yields:
+        (s, row) for every source s, where row[t] is the shortest distance from
+        s to t, or INF if t is unreachable.
+        Raises ValueError (before the first row) if the graph has a negative
+        cycle.
+
+    Time Complexity: O(V * E + V * E log V)
+    Aux Space Complexity: O(V + E), plus one row per yielded source
+    """
+    # Build the CSR graph once (or reuse the one passed in)
+    graph = as_csr(edges, weight_first=True)
+    V = graph.num_vertices
+    if sources is None:
+        sources = range(V)
+
+    h = johnson_potentials(graph)
+    reweighted = reweight(graph, h)
+
+    for s in sources:
+        dist = dijkstra_distances(reweighted, s, arity=arity)
+        hs = h[s]
+        yield s, [d - hs + h[t] if d != INF else INF for t, d in enumerate(dist)]
+
+
+if __name__ == '__main__':
+    from algorithms_graph.floyd_warshall import floyd_warshall
+
+    edges = [
+        (3, 0, 1),
+        (8, 0, 3),
+        (-4, 1, 2),
+        (1, 2, 0),
+        (2, 2, 0),
+        (5, 3, 1),
+        (-2, 3, 4)
+    ]
+    expected = floyd_warshall(edges)
+    for s, row in johnson(edges):
+        assert row == expected[s], f'Row {s}: expected {expected[s]}, got {row}'
+
+    # Only some rows, one at a time
+    rows = dict(johnson(edges, sources=[3]))
+    assert list(rows) == [3] and rows[3] == expected[3]
+
+    # Negative cycle
+    try:
+        next(johnson([(1, 0, 1), (-2, 1, 0)]))
+        assert False, 'Expected a negative cycle'
+    except ValueError:
+        pass
+
+    print('All tests passed')
@@ -8,14 +8,15 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from data_structures.UnionFind import UnionFind
+from graph_representation.csr_graph import CSRGraph
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 #! =============================================================================|
 #! KRUSKAL'S ALGORITHM
 #! =============================================================================|
 
-def kruskal(edges: List[Tuple[int,int,int]]) -> List[Tuple[int,int,int]]:
+def kruskal(edges: Union[List[Tuple[int,int,int]], CSRGraph]) -> List[Tuple[int,int,int]]:
     """
     Kruskal's MST algorithm
     
@@ -34,7 +35,8 @@ def kruskal(edges: List[Tuple[int,int,int]]) -> List[Tuple[int,int,int]]:
         4. At most V-1 edges are added to the MST.
     
     Args:
-        - edges: List of undirected edges (u,v,w), 1-based vertices
+        - edges: List of undirected edges (u,v,w), 1-based vertices, or a
+        CSRGraph (edges stored in both directions are simply skipped by `find`)
 
     Returns:
         List of edges (u,v,w) in the minimum spanning tree.
@@ -52,6 +54,9 @@ def kruskal(edges: List[Tuple[int,int,int]]) -> List[Tuple[int,int,int]]:
         - Union-Find parent array: O(V)
         - Output MST list: O(V)
     """
+    if isinstance(edges, CSRGraph):
+        edges = list(edges.edges())
+    
     n = 0
     for u,v,_ in edges:
         n = max(n, u, v)
@@ -1,26 +1,30 @@
-from typing import List, Tuple, Set
-import heapq
+import os
+import sys
+from typing import List, Tuple, Set, Union
 import math
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+from data_structures.IndexedMinHeap import IndexedMinHeap
+
 INF = math.inf
 
-def prims(edges: List[Tuple[int, int, int]], root: int):
+def prims(edges: Union[List[Tuple[int, int, int]], CSRGraph], root: int, arity: int = 4):
     """
     Prim's algorithm to compute a MST of a connected, undirected graph
+    
+    `edges` is either a list of undirected edges (u, v, w) or a CSRGraph that
+    already stores every edge in both directions.
 
     Time Complexity: O(E log V)
-    Aux Space Complexity: O(V + E)
+    Aux Space Complexity: O(V)
+        The indexed heap holds each vertex at most once (decrease-key instead
+        of pushing duplicates), on top of the O(V + E) input graph.
     """
-    # Find V and build adj list
-    V = 0
-    for u,v,_ in edges:
-        V = max(V, u, v)
-    V += 1
-    
-    adj = [[] for _ in range(V)]
-    for u,v,w in edges:
-        adj[u].append((v,w))
-        adj[v].append((u,w))    
+    # Build the undirected CSR graph once (or reuse the one passed in)
+    graph = as_csr(edges, undirected=True)
+    V = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
     
     # Initialise dist, parent and visited set
     dist = [INF] * V
@@ -30,15 +34,12 @@ def prims(edges: List[Tuple[int, int, int]], root: int):
     visited = set()
     mst_edges = []
     
-    # Priority queue of (dist, node)
-    min_heap = [(0, root)]
+    # Indexed priority queue of nodes keyed by dist
+    min_heap = IndexedMinHeap(V, arity)
+    min_heap.push(root, 0)
     
     while min_heap:
-        d_u, u = heapq.heappop(min_heap)
-        
-        # Skip outdated entries
-        if u in visited or d_u > dist[u]:
-            continue
+        u = min_heap.pop()
         
         # Mark u as added to the MST
         visited.add(u)
@@ -47,11 +48,12 @@ def prims(edges: List[Tuple[int, int, int]], root: int):
             mst_edges.append((parent[u], u, int(dist[u])))
         
         # Relax edges (u,v)
-        for v, weight in adj[u]:
+        for e in range(offsets[u], offsets[u + 1]):
+            v, weight = targets[e], weights[e]
             if v not in visited and weight < dist[v]:
                 dist[v] = weight
                 parent[v] = u
-                heapq.heappush(min_heap, (weight, v))
+                min_heap.push_or_decrease(v, weight)
                 
     return visited, mst_edges
 
@@ -1,26 +1,31 @@
-from typing import List, Tuple
+import os
+import sys
+from typing import List, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+from algorithms_graph.strongly_connected_components import strongly_connected_components
 
 Weight = int
 Node = int
 Edge = Tuple[Weight, Node, Node]
 
-def transitive_closure(edges: List[Edge]) -> List[List[bool]]:
+def transitive_closure(edges: Union[List[Edge], CSRGraph]) -> List[List[bool]]:
     """ 
     ! Computes the transitive closure of a graph
     
     Args: 
         edges: A list of edges, where each edge is (weight, u, v).
-                Nodes u and v are assumed to be 0-indexed.
+                Nodes u and v are assumed to be 0-indexed. A CSRGraph is
+                also accepted.
                 
     Returns:
         A 2D boolean matrix where matrix[i][j] is True if there is a path
         from node i to node j, and False otherwise.
     """
-    # Find the maximum number of vertices
-    V = 0
-    for edge in edges:
-        V = max(V, edge[1], edge[2])
-    V += 1
+    # Build the CSR graph once (or reuse the one passed in)
+    graph = as_csr(edges, weight_first=True)
+    V = graph.num_vertices
     
     # Initialize adjacency matrix to track reachability between vertices
     connected = [[False] * V for _ in range(V)]
@@ -30,9 +35,7 @@ def transitive_closure(edges: List[Edge]) -> List[List[bool]]:
         connected[node][node] = True
 
     # Edges connect their corresponding vertices (path of length 1)
-    for edge in edges:
-        _, u, v = edge
-        
+    for u, v, _ in graph.edges():
         connected[u][v] = True
     
     # Core logic
@@ -44,6 +47,92 @@ def transitive_closure(edges: List[Edge]) -> List[List[bool]]:
                 
     return connected
 
+def transitive_closure_bits(
+    edges: Union[List[Edge], CSRGraph],
+    method: str = 'condensation'
+) -> List[int]:
+    """
+    ! Computes the transitive closure as one bitset per vertex
+    
+    Row u is a Python int where bit v is set if there is a path from u to v
+    (every vertex reaches itself). A row costs V bits instead of V list slots,
+    and combining two rows is a single big-int OR over V / 64 machine words.
+    
+    Args:
+        edges: A list of edges (weight, u, v), or a CSRGraph.
+        method: One of:
+            - 'warshall': Warshall's algorithm with whole-row ORs,
+              rows[u] |= rows[k] whenever u reaches k.
+            - 'condensation': collapse the SCCs (every vertex of an SCC has
+              the same row), then build the rows of the condensation DAG in
+              reverse topological order, each as the OR of its successors'
+              rows. The members of an SCC share one int object.
+    
+    Returns:
+        rows, a list of V ints (see reaches).
+    
+    Time Complexity:
+        - 'warshall': O(V^3 / 64)
+        - 'condensation': O(V + E * V / 64)
+    Aux Space Complexity: O(V^2 / 64) words (less with 'condensation' when SCCs
+        are large)
+    """
+    graph = as_csr(edges, weight_first=True)
+    if method == 'warshall':
+        return _closure_warshall(graph)
+    if method == 'condensation':
+        return _closure_condensation(graph)
+    raise ValueError(f"Unknown method {method!r}, expected 'warshall' or 'condensation'")
+
+def _closure_warshall(graph: CSRGraph) -> List[int]:
+    V = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    
+    rows = [1 << u for u in range(V)]
+    for u in range(V):
+        row = rows[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            row |= 1 << targets[e]
+        rows[u] = row
+    
+    for k in range(V): # Intermediate vertex
+        bit = 1 << k
+        row_k = rows[k]
+        for u in range(V): # Source vertex, all destinations at once
+            if rows[u] & bit:
+                rows[u] |= row_k
+    return rows
+
+def _closure_condensation(graph: CSRGraph) -> List[int]:
+    V = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+    num_components, comp = strongly_connected_components(graph)
+    
+    # Group the vertices by component
+    members: List[List[int]] = [[] for _ in range(num_components)]
+    for v in range(V):
+        members[comp[v]].append(v)
+    
+    # Component ids are a reverse topological order: every edge leaving
+    # component c goes to a smaller id, whose row is already final
+    reach = [0] * num_components
+    for c in range(num_components):
+        row = 0
+        for v in members[c]:
+            row |= 1 << v
+        for u in members[c]:
+            for e in range(offsets[u], offsets[u + 1]):
+                d = comp[targets[e]]
+                if d != c:
+                    row |= reach[d]
+        reach[c] = row
+    
+    return [reach[comp[v]] for v in range(V)]
+
+def reaches(rows: List[int], u: Node, v: Node) -> bool:
+    """True if there is a path from u to v in a closure from transitive_closure_bits"""
+    return (rows[u] >> v) & 1 == 1
+
 if __name__ == '__main__':
     # Example graph edges (weight is irrelevant here, set to 1)
     edges = [
@@ -63,4 +152,11 @@ if __name__ == '__main__':
     
     print('\nTransitive Closure Matrix:')
     for row in matrix:
-        print([f'{x:5}' for x in row])
\ No newline at end of file
+        print([f'{x:5}' for x in row])
+    
+    # The bitset closures agree with the boolean matrix
+    for method in ('warshall', 'condensation'):
+        rows = transitive_closure_bits(edges, method)
+        for u in range(len(matrix)):
+            for v in range(len(matrix)):
+                assert reaches(rows, u, v) == matrix[u][v], f'{method}: wrong entry ({u}, {v})'
@@ -0,0 +1,90 @@
+"""
+? Name
+Capacitated Bipartite Assignment Benchmark
+
+? Description
+Times `capacitated_assignment` (flat-array residual graph, with the default
+DFS engine and with Dinic) against the NetworkX path the assignment problems
+used before: a string-keyed `networkx.DiGraph` solved with
+`networkx.maximum_flow`. Both must assign the same number of people.
+
+Every person picks 1 to `max_prefs` random slots; a few slots are much more
+popular than the rest so the capacities actually bind.
+
+NetworkX is only imported when this benchmark runs, and skipped if it is not
+installed.
+
+? Usage
+python benchmarks/bench_bipartite_assignment.py [num_people num_slots capacity]
+"""
+import os
+import sys
+import random
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms_graph.bipartite_assignment import capacitated_assignment
+
+def random_preferences(num_people: int, num_slots: int, max_prefs: int = 4, seed: int = 0):
+    rng = random.Random(seed)
+    # Slot k is picked with weight 1 / k
+    slots = list(range(1, num_slots + 1))
+    weights = [1 / k for k in slots]
+    prefs = {}
+    for person in range(num_people):
+        chosen = set(rng.choices(slots, weights, k=rng.randint(1, max_prefs)))
+        prefs[person] = sorted(chosen)
+    return prefs
+
+def networkx_assignment(nx, preferences, num_slots: int, capacity: int):
+    G = nx.DiGraph()
+    for person, slots in preferences.items():
+        G.add_edge('src', person, capacity=1)
+        for k in slots:
+            G.add_edge(person, f'slot_{k}', capacity=1)
+    for k in range(1, num_slots + 1):
+        G.add_edge(f'slot_{k}', 'sink', capacity=capacity)
+    _, flow_dict = nx.maximum_flow(G, 'src', 'sink')
+
+    assignments = {}
+    for person, slots in preferences.items():
+        for k in slots:
+            if flow_dict.get(person, {}).get(f'slot_{k}', 0) == 1:
+                assignments[person] = k
+                break
+    return assignments
+
+def run(num_people: int, num_slots: int, capacity: int):
+    prefs = random_preferences(num_people, num_slots)
+    print(f'people={num_people}, slots={num_slots}, capacity={capacity}, '
+          f'preferences={sum(map(len, prefs.values()))}')
+
+    expected = None
+    for algorithm in ('dfs', 'dinic'):
+        t0 = time.perf_counter()
+        size = len(capacitated_assignment(prefs, num_slots, capacity, algorithm))
+        elapsed = time.perf_counter() - t0
+        if expected is None:
+            expected = size
+        assert size == expected
+        print(f'  {algorithm:<9} {elapsed * 1e3:9.1f} ms  (assigned {size})')
+
+    try:
+        t0 = time.perf_counter()
+        import networkx as nx
+        imported = time.perf_counter()
+    except ImportError:
+        print('  networkx  not installed, skipped')
+        return
+    size = len(networkx_assignment(nx, prefs, num_slots, capacity))
+    elapsed = time.perf_counter() - imported
+    assert size == expected, f'networkx assigned {size}, expected {expected}'
+    print(f'  networkx  {elapsed * 1e3:9.1f} ms  (assigned {size}, '
+          f'import {(imported - t0) * 1e3:.1f} ms)')
+
+if __name__ == '__main__':
+    if len(sys.argv) > 3:
+        run(int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        run(123, 24, 5)
+        run(20_000, 500, 30)
@@ -0,0 +1,92 @@
+"""
+? Name
+Contraction Hierarchies Benchmark
+
+? Description
+Builds a contraction hierarchy for a synthetic grid graph (road-like, 4
+neighbours) and a random geometric graph (points in the unit square joined
+when closer than a radius), then reports:
+
+- preprocessing time and number of shortcuts
+- average query latency of the CH query vs plain `dijkstra` (stopping at the
+  target) over the same random (s, t) pairs
+
+? Usage
+python benchmarks/bench_contraction_hierarchies.py
+"""
+import os
+import sys
+import math
+import random
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph
+from algorithms_graph.dijkstra import dijkstra_distances
+from algorithms_graph.contraction_hierarchies import ContractionHierarchy
+
+def grid_graph(side: int, seed: int = 0) -> CSRGraph:
+    rng = random.Random(seed)
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            u = r * side + c
+            for dr, dc in ((0, 1), (1, 0)):
+                if r + dr < side and c + dc < side:
+                    v = (r + dr) * side + c + dc
+                    w = rng.randint(10, 100)
+                    edges.append((u, v, w))
+                    edges.append((v, u, w))
+    return CSRGraph.from_edges(edges, num_vertices=side * side)
+
+def random_geometric_graph(V: int, avg_degree: float = 6, seed: int = 0) -> CSRGraph:
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(V)]
+    radius = math.sqrt(avg_degree / (math.pi * V))
+
+    # Bucket the points into cells of size radius to find close pairs quickly
+    cells = {}
+    for i, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(i)
+
+    edges = []
+    for (cx, cy), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in cells.get((cx + dx, cy + dy), ()):
+                    for i in members:
+                        if i < j:
+                            d = math.dist(points[i], points[j])
+                            if d <= radius:
+                                w = int(d * 10_000) + 1
+                                edges.append((i, j, w))
+                                edges.append((j, i, w))
+    return CSRGraph.from_edges(edges, num_vertices=V)
+
+def run(name: str, graph: CSRGraph, num_queries: int = 200, seed: int = 0):
+    rng = random.Random(seed)
+    V = graph.num_vertices
+
+    t0 = time.perf_counter()
+    ch = ContractionHierarchy.build(graph)
+    preprocessing = time.perf_counter() - t0
+
+    pairs = [(rng.randrange(V), rng.randrange(V)) for _ in range(num_queries)]
+
+    t0 = time.perf_counter()
+    expected = [dijkstra_distances(graph, s, target=t)[t] for s, t in pairs]
+    dijkstra_time = (time.perf_counter() - t0) / num_queries
+
+    t0 = time.perf_counter()
+    results = [ch.query(s, t) for s, t in pairs]
+    ch_time = (time.perf_counter() - t0) / num_queries
+    assert results == expected
+
+    print(f'{name}: V={V}, E={graph.num_edges}')
+    print(f'  preprocessing: {preprocessing:.2f} s, shortcuts: {ch.num_shortcuts}')
+    print(f'  dijkstra query: {dijkstra_time * 1e3:.3f} ms')
+    print(f'  CH query:       {ch_time * 1e3:.3f} ms ({dijkstra_time / ch_time:.1f}x faster)')
+
+if __name__ == '__main__':
+    run('Grid 60x60', grid_graph(60))
+    run('Random geometric', random_geometric_graph(4000))
@@ -0,0 +1,49 @@
+"""
+? Name
+Parallel Blocked Floyd-Warshall Benchmark
+
+? Description
+Runs the blocked NumPy Floyd-Warshall on a random dense-ish graph with 1, 2,
+4 and 8 worker processes (the matrix lives in shared memory) and reports the
+time and the speedup over a single worker. Every run must give the same
+matrix.
+
+The speedup is bounded by the number of cores: with fewer cores than workers
+the extra processes only add synchronisation overhead.
+
+? Usage
+python benchmarks/bench_floyd_warshall_parallel.py [V]
+"""
+import os
+import sys
+import random
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms_graph.floyd_warshall import floyd_warshall_numpy
+
+WORKERS = (1, 2, 4, 8)
+
+def random_edges(V: int, avg_degree: int = 20, seed: int = 0):
+    rng = random.Random(seed)
+    return [(rng.randint(1, 1000), rng.randrange(V), rng.randrange(V)) for _ in range(V * avg_degree)]
+
+def run(V: int):
+    edges = random_edges(V)
+    print(f'V={V}, E={len(edges)}, cores={os.cpu_count()}')
+
+    baseline = None
+    expected = None
+    for workers in WORKERS:
+        t0 = time.perf_counter()
+        dist = floyd_warshall_numpy(edges, workers=workers)
+        elapsed = time.perf_counter() - t0
+
+        if expected is None:
+            expected, baseline = dist, elapsed
+        else:
+            assert (dist == expected).all(), f'{workers} workers gave a different matrix'
+        print(f'  {workers} worker(s): {elapsed:7.2f} s  speedup {baseline / elapsed:.2f}x')
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,62 @@
+"""
+? Name
+Min-Cost Max-Flow Benchmark
+
+? Description
+Times the two `min_cost_flow` methods, successive shortest paths ('ssp') and
+cost scaling ('cost_scaling'), on
+
+- ranked assignment: `capacitated_assignment(..., ranked=True)` on the
+  random preferences of bench_bipartite_assignment (small flow, costs 0..3)
+- grid and layered networks from bench_max_flow with random costs 0..100
+  (large capacities, so the flow value is large)
+
+Both methods must find the same flow value and cost.
+
+? Usage
+python benchmarks/bench_min_cost_flow.py
+"""
+import os
+import sys
+import random
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms_graph.min_cost_flow import METHODS, min_cost_flow
+from algorithms_graph.bipartite_assignment import capacitated_assignment
+from benchmarks.bench_bipartite_assignment import random_preferences
+from benchmarks.bench_max_flow import grid_network, layered_network
+
+def run_assignment(num_people: int, num_slots: int, capacity: int):
+    prefs = random_preferences(num_people, num_slots)
+    print(f'Ranked assignment: people={num_people}, slots={num_slots}, capacity={capacity}')
+    expected = None
+    for method in METHODS:
+        t0 = time.perf_counter()
+        result = capacitated_assignment(prefs, num_slots, capacity, method, ranked=True)
+        elapsed = time.perf_counter() - t0
+        found = (len(result), sum(prefs[person].index(k) for person, k in result.items()))
+        if expected is None:
+            expected = found
+        assert found == expected, f'{method} found {found}, expected {expected}'
+        print(f'  {method:<13} {elapsed * 1e3:9.1f} ms  (assigned {found[0]}, total rank {found[1]})')
+
+def run_network(name: str, network, seed: int = 0):
+    n, edges, s, t = network
+    rng = random.Random(seed)
+    edges = [(u, v, c, rng.randint(0, 100)) for u, v, c in edges]
+    print(f'{name}: V={n}, E={len(edges)}')
+    expected = None
+    for method in METHODS:
+        t0 = time.perf_counter()
+        value, cost, _ = min_cost_flow(n, edges, s, t, method)
+        elapsed = time.perf_counter() - t0
+        if expected is None:
+            expected = (value, cost)
+        assert (value, cost) == expected, f'{method} found {(value, cost)}, expected {expected}'
+        print(f'  {method:<13} {elapsed * 1e3:9.1f} ms  (flow {value}, cost {cost})')
+
+if __name__ == '__main__':
+    run_assignment(2_000, 100, 15)
+    run_network('Grid 20x20', grid_network(20))
+    run_network('Layered 8x30, degree 5', layered_network(8, 30, 5))
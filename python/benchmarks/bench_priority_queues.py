@@ -0,0 +1,95 @@
+"""
+? Name
+Priority Queue Benchmark (lazy-deletion heapq vs indexed d-ary heap)
+
+? Description
+Runs the same CSR Dijkstra kernel with two priority queues on random directed
+graphs of increasing density:
+
+- heapq: pushes a duplicate (dist, node) entry on every relaxation and skips
+  the stale ones when popped, so the heap grows to O(E).
+- indexed: IndexedMinHeap with real decrease-key, holding each node at most
+  once, so the heap stays O(V).
+
+Reports the run time and the peak number of heap entries for each.
+
+? Usage
+python benchmarks/bench_priority_queues.py
+"""
+import os
+import sys
+import random
+import time
+from heapq import heappop, heappush
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph
+from data_structures.IndexedMinHeap import IndexedMinHeap
+
+INF = float('inf')
+
+def random_graph(V: int, avg_degree: int, max_weight: int = 1000, seed: int = 0) -> CSRGraph:
+    rng = random.Random(seed)
+    edges = [
+        (rng.randrange(V), rng.randrange(V), rng.randint(1, max_weight))
+        for _ in range(V * avg_degree)
+    ]
+    return CSRGraph.from_edges(edges, num_vertices=V)
+
+def dijkstra_lazy_heapq(graph: CSRGraph, start: int):
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [INF] * graph.num_vertices
+    dist[start] = 0
+    heap = [(0, start)]
+    peak = 1
+    while heap:
+        d, u = heappop(heap)
+        if d > dist[u]:
+            continue
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            nd = d + weights[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                heappush(heap, (nd, v))
+        if len(heap) > peak:
+            peak = len(heap)
+    return dist, peak
+
+def dijkstra_indexed(graph: CSRGraph, start: int, arity: int):
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [INF] * graph.num_vertices
+    dist[start] = 0
+    heap = IndexedMinHeap(graph.num_vertices, arity)
+    heap.push(start, 0)
+    peak = 1
+    while heap:
+        u = heap.pop()
+        d = dist[u]
+        for e in range(offsets[u], offsets[u + 1]):
+            v = targets[e]
+            nd = d + weights[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                heap.push_or_decrease(v, nd)
+        if len(heap) > peak:
+            peak = len(heap)
+    return dist, peak
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - t0, result
+
+if __name__ == '__main__':
+    V = 20_000
+    print(f'V = {V}')
+    print(f'{"avg deg":>8} {"E":>9} | {"queue":>10} {"time (s)":>9} {"peak heap":>10}')
+    for avg_degree in (2, 8, 32, 64):
+        graph = random_graph(V, avg_degree)
+        t, (expected, peak) = timed(dijkstra_lazy_heapq, graph, 0)
+        print(f'{avg_degree:>8} {graph.num_edges:>9} | {"heapq":>10} {t:>9.3f} {peak:>10}')
+        for arity in (2, 4, 8):
+            t, (dist, peak) = timed(dijkstra_indexed, graph, 0, arity)
+            assert dist == expected
+            print(f'{"":>8} {"":>9} | {f"indexed-{arity}":>10} {t:>9.3f} {peak:>10}')
@@ -0,0 +1,188 @@
+from typing import List
+from array import array
+
+class IndexedMinHeap:
+    """
+    Indexed d-ary Min Heap (priority queue with decrease-key)
+
+    Holds at most one entry for each item 0..capacity-1, so the heap never
+    grows beyond O(V) entries, unlike pushing duplicates into `heapq` and
+    skipping the stale ones.
+
+    Storage (flat arrays, no per-entry tuples):
+        - heap: array('i'), heap[i] is the item at heap slot i
+        - pos: array('i'), pos[item] is the slot of item, or -1 if absent
+        - keys: list, keys[item] is the current key of item
+
+    Operations:
+        - push(item, key): Insert an item that is not in the heap. O(log_d n)
+        - decrease_key(item, key): Lower the key of an item in the heap. O(log_d n)
+        - push_or_decrease(item, key) -> bool: Insert or lower, whichever applies
+        - pop() -> int: Remove and return the item with the smallest key.
+            O(d log_d n). Its key stays readable through key(item).
+        - peek() -> int: The item with the smallest key. O(1)
+
+    A larger arity d makes the tree shallower, so decrease-key (the common
+    operation in Dijkstra/Prim on dense graphs) gets cheaper while pop does
+    more comparisons per level. d = 4 is a good default.
+    """
+    __slots__ = ('arity', 'heap', 'pos', 'keys', 'size')
+
+    def __init__(self, capacity: int, arity: int = 4):
+        if arity < 2:
+            raise ValueError('Heap arity must be at least 2')
+        self.arity = arity
+        self.heap = array('i', [0]) * capacity
+        self.pos = array('i', [-1]) * capacity
+        self.keys: List = [0] * capacity
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __contains__(self, item: int) -> bool:
+        return self.pos[item] != -1
+
+    def key(self, item: int):
+        return self.keys[item]
+
+    def peek(self) -> int:
+        if self.size == 0:
+            raise IndexError('peek from an empty heap')
+        return self.heap[0]
+
+    def push(self, item: int, key) -> None:
+        if self.pos[item] != -1:
+            raise ValueError(f'Item {item} is already in the heap')
+        i = self.size
+        self.size += 1
+        self.keys[item] = key
+        self.heap[i] = item
+        self.pos[item] = i
+        self._sift_up(i)
+
+    def decrease_key(self, item: int, key) -> None:
+        i = self.pos[item]
+        if i == -1:
+            raise KeyError(f'Item {item} is not in the heap')
+        if key > self.keys[item]:
+            raise ValueError('New key is larger than the current key')
+        self.keys[item] = key
+        self._sift_up(i)
+
+    def push_or_decrease(self, item: int, key) -> bool:
+        """
+        Inserts the item, or lowers its key if it is already queued and `key`
+        is smaller. Returns True if the heap changed.
+        """
+        i = self.pos[item]
+        if i == -1:
+            i = self.size
+            self.size += 1
+            self.keys[item] = key
+            self.heap[i] = item
+            self.pos[item] = i
+            self._sift_up(i)
+            return True
+        if key < self.keys[item]:
+            self.keys[item] = key
+            self._sift_up(i)
+            return True
+        return False
+
+    def pop(self) -> int:
+        if self.size == 0:
+            raise IndexError('pop from an empty heap')
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        pos[top] = -1
+        self.size -= 1
+        if self.size > 0:
+            last = heap[self.size]
+            heap[0] = last
+            pos[last] = 0
+            self._sift_down(0)
+        return top
+
+    def clear(self) -> None:
+        """Empties the heap in O(n) so it can be reused without reallocating"""
+        heap, pos = self.heap, self.pos
+        for i in range(self.size):
+            pos[heap[i]] = -1
+        self.size = 0
+
+    def _sift_up(self, i: int) -> None:
+        heap, pos, keys, d = self.heap, self.pos, self.keys, self.arity
+        item = heap[i]
+        key = keys[item]
+        while i > 0:
+            parent = (i - 1) // d
+            parent_item = heap[parent]
+            if keys[parent_item] <= key:
+                break
+            # Move the parent down into the hole
+            heap[i] = parent_item
+            pos[parent_item] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, pos, keys, d, size = self.heap, self.pos, self.keys, self.arity, self.size
+        item = heap[i]
+        key = keys[item]
+        while True:
+            first = d * i + 1
+            if first >= size:
+                break
+            # Find the child with the smallest key
+            best = first
+            best_key = keys[heap[first]]
+            for c in range(first + 1, min(first + d, size)):
+                c_key = keys[heap[c]]
+                if c_key < best_key:
+                    best, best_key = c, c_key
+            if best_key >= key:
+                break
+            # Move the smallest child up into the hole
+            child_item = heap[best]
+            heap[i] = child_item
+            pos[child_item] = i
+            i = best
+        heap[i] = item
+        pos[item] = i
+
+
+if __name__ == '__main__':
+    import random
+
+    for arity in (2, 3, 4, 8):
+        heap = IndexedMinHeap(100, arity)
+        keys = {}
+        for item in random.sample(range(100), 60):
+            keys[item] = random.randint(0, 1000)
+            heap.push(item, keys[item])
+
+        # Lower some of the keys
+        for item in random.sample(sorted(keys), 20):
+            keys[item] -= random.randint(0, 500)
+            heap.decrease_key(item, keys[item])
+
+        assert len(heap) == 60
+        popped = []
+        while heap:
+            item = heap.pop()
+            assert item not in heap
+            popped.append(heap.key(item))
+        assert popped == sorted(keys.values()), f'Heap order broken for arity {arity}'
+
+    heap = IndexedMinHeap(5)
+    assert heap.push_or_decrease(3, 10) is True
+    assert heap.push_or_decrease(3, 12) is False
+    assert heap.push_or_decrease(3, 7) is True
+    assert heap.peek() == 3 and heap.key(3) == 7
+
+    print('All IndexedMinHeap tests passed')
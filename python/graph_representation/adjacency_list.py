@@ -1,10 +1,21 @@
-from typing import List, Tuple, Optional
+import os
+import sys
+from typing import List, Tuple, Optional, Union
 from collections import deque
 
-def build_adjacency_list(edges: List[Tuple[int, int, int]]):
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from graph_representation.csr_graph import CSRGraph
+
+def build_adjacency_list(edges: Union[List[Tuple[int, int, int]], CSRGraph]):
     """
     Build the adjacency list of a directed, weighted graph
     
+    Args:
+        edges: List of edges (u, v, w), or a CSRGraph. A CSRGraph already
+            knows V and keeps every vertex's edges contiguous, so each inner
+            list is one slice of its buffers. For repeated queries on a large
+            graph, pass the CSRGraph to the algorithms directly instead.
+    
     Time Complexity: O(V + E)
     Time Complexity Analysis:
         - Scan edges to find max node ID: O(E)
@@ -15,6 +26,13 @@ def build_adjacency_list(edges: List[Tuple[int, int, int]]):
     Aux Space Complexity Analysis:
         - A list with V entries each with inner lists of E size.
     """
+    if isinstance(edges, CSRGraph):
+        offsets, targets, weights = edges.offsets, edges.targets, edges.weights
+        return [
+            list(zip(targets[offsets[u]:offsets[u + 1]], weights[offsets[u]:offsets[u + 1]]))
+            for u in range(edges.num_vertices)
+        ]
+    
     V = 0
     for u,v,_ in edges:
         V = max(V, u, v)
@@ -0,0 +1,234 @@
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from array import array
+
+Edge = Tuple[int, int, int]
+
+class CSRGraph:
+    """
+    Compressed Sparse Row (CSR) representation of a directed, weighted graph
+
+    The outgoing edges of vertex u are stored contiguously at the indices
+    offsets[u] .. offsets[u+1]-1 of the `targets` and `weights` buffers, so the
+    graph is built once and then traversed by every algorithm without any
+    per-call adjacency list (or tuple) allocation.
+
+    Buffers:
+        - offsets: array('i') of length V + 1
+        - targets: array('i') of length E
+        - weights: array('q') if every weight is an int, otherwise array('d')
+
+    Iterating the neighbours of u:
+        for e in range(graph.offsets[u], graph.offsets[u + 1]):
+            v, w = graph.targets[e], graph.weights[e]
+    """
+    __slots__ = ('num_vertices', 'num_edges', 'offsets', 'targets', 'weights', '_max_weight')
+
+    def __init__(self, num_vertices: int, offsets: array, targets: array, weights: array):
+        self.num_vertices = num_vertices
+        self.num_edges = len(targets)
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._max_weight = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Edge],
+        num_vertices: Optional[int] = None,
+        weight_first: bool = False,
+        undirected: bool = False
+    ) -> 'CSRGraph':
+        """
+        Build a CSR graph from an edge list using a counting sort on the source
+        vertex.
+
+        Args:
+            edges: List of edges (u, v, w), or (w, u, v) if `weight_first`.
+            num_vertices: Optional. If None, inferred as max vertex id + 1.
+            weight_first: True if the edges are given as (w, u, v).
+            undirected: True to store every edge in both directions.
+
+        Time Complexity: O(V + E)
+        Time Complexity Analysis:
+            - One pass to count the out-degree of every vertex: O(E)
+            - Prefix sum over the degrees to get the offsets: O(V)
+            - One pass to place every edge in its slot: O(E)
+
+        Aux Space Complexity: O(V + E)
+        Aux Space Complexity Analysis:
+            - The offsets buffer: O(V)
+            - The targets and weights buffers: O(E)
+        """
+        if not isinstance(edges, list):
+            edges = list(edges)
+        ui, vi, wi = (1, 2, 0) if weight_first else (0, 1, 2)
+
+        # Count the out-degrees and check whether the weights are all integers
+        V = 0 if num_vertices is None else num_vertices
+        degree: List[int] = [0] * (V + 1)
+        integral = True
+        for edge in edges:
+            u, v = edge[ui], edge[vi]
+            if num_vertices is None and (u >= V or v >= V):
+                degree.extend([0] * (max(u, v) + 1 - V))
+                V = max(u, v) + 1
+            degree[u] += 1
+            if undirected:
+                degree[v] += 1
+            if integral and type(edge[wi]) is not int:
+                integral = False
+
+        # Prefix sum of the degrees gives the start of each vertex's slice
+        offsets = array('i', [0]) * (V + 1)
+        total = 0
+        for u in range(V):
+            offsets[u] = total
+            total += degree[u]
+        offsets[V] = total
+
+        # Place every edge at the next free slot of its source vertex
+        targets = array('i', [0]) * total
+        weights = array('q' if integral else 'd', [0]) * total
+        slot = offsets[:V]
+        for edge in edges:
+            u, v, w = edge[ui], edge[vi], edge[wi]
+            i = slot[u]
+            targets[i] = v
+            weights[i] = w
+            slot[u] = i + 1
+            if undirected:
+                i = slot[v]
+                targets[i] = u
+                weights[i] = w
+                slot[v] = i + 1
+
+        return cls(V, offsets, targets, weights)
+
+    def reverse(self) -> 'CSRGraph':
+        """
+        Builds the transposed graph (every edge u -> v becomes v -> u), used
+        for backward searches such as bidirectional Dijkstra.
+
+        Time Complexity: O(V + E)
+        Aux Space Complexity: O(V + E)
+        """
+        V = self.num_vertices
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+
+        # Count the in-degrees, which become the out-degrees of the reverse
+        rev_offsets = array('i', [0]) * (V + 1)
+        for v in targets:
+            rev_offsets[v + 1] += 1
+        for u in range(V):
+            rev_offsets[u + 1] += rev_offsets[u]
+
+        rev_targets = array('i', [0]) * self.num_edges
+        rev_weights = array(weights.typecode, [0]) * self.num_edges
+        slot = rev_offsets[:V]
+        for u in range(V):
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                i = slot[v]
+                rev_targets[i] = u
+                rev_weights[i] = weights[e]
+                slot[v] = i + 1
+
+        return CSRGraph(V, rev_offsets, rev_targets, rev_weights)
+
+    @property
+    def integral(self) -> bool:
+        """True if every edge weight is an int"""
+        return self.weights.typecode == 'q'
+
+    def max_weight(self):
+        """
+        Largest edge weight (0 for a graph without edges), computed once and
+        cached since the buffers are not meant to change after the build.
+
+        Time Complexity: O(E) on the first call, O(1) after that
+        """
+        if self._max_weight is None:
+            self._max_weight = max(self.weights, default=0)
+        return self._max_weight
+
+    def neighbours(self, u: int) -> Iterator[Tuple[int, int]]:
+        """
+        Yields the (v, w) pairs of the outgoing edges of u
+
+        Time Complexity: O(degree(u))
+        """
+        targets, weights = self.targets, self.weights
+        for e in range(self.offsets[u], self.offsets[u + 1]):
+            yield targets[e], weights[e]
+
+    def out_degree(self, u: int) -> int:
+        """
+        Returns the number of edges LEAVING node `u`
+
+        Time Complexity: O(1)
+        """
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def edges(self) -> Iterator[Edge]:
+        """
+        Yields every edge as (u, v, w) in source order
+
+        Time Complexity: O(V + E)
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        for u in range(self.num_vertices):
+            for e in range(offsets[u], offsets[u + 1]):
+                yield u, targets[e], weights[e]
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __repr__(self) -> str:
+        return f'CSRGraph(num_vertices={self.num_vertices}, num_edges={self.num_edges})'
+
+
+def as_csr(
+    graph: Union[CSRGraph, Iterable[Edge]],
+    num_vertices: Optional[int] = None,
+    weight_first: bool = False,
+    undirected: bool = False
+) -> CSRGraph:
+    """
+    Returns `graph` unchanged if it is already a CSRGraph, otherwise builds one
+    from the edge list. This lets every algorithm accept either input.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_edges(graph, num_vertices, weight_first, undirected)
+
+
+if __name__ == '__main__':
+    edges = [
+        (0, 1, 4),
+        (0, 2, 1),
+        (2, 1, 2),
+        (1, 3, 1),
+        (2, 3, 5)
+    ]
+    graph = CSRGraph.from_edges(edges)
+    print(graph)
+    assert graph.num_vertices == 4 and graph.num_edges == 5
+    assert list(graph.offsets) == [0, 2, 3, 5, 5]
+    assert sorted(graph.neighbours(0)) == [(1, 4), (2, 1)]
+    assert sorted(graph.edges()) == sorted(edges)
+    assert graph.integral and graph.max_weight() == 5
+    assert sorted(graph.reverse().edges()) == sorted((v, u, w) for u, v, w in edges)
+
+    # (w, u, v) input with float weights and an explicit vertex count
+    graph = CSRGraph.from_edges([(0.5, 0, 1), (1.5, 1, 2)], num_vertices=5, weight_first=True)
+    assert graph.num_vertices == 5 and graph.weights.typecode == 'd'
+    assert list(graph.neighbours(1)) == [(2, 1.5)]
+    assert graph.out_degree(4) == 0
+
+    # Undirected graphs store both directions
+    graph = CSRGraph.from_edges([(0, 1, 3)], undirected=True)
+    assert list(graph.neighbours(1)) == [(0, 3)]
+    assert as_csr(graph) is graph
+
+    print('All tests passed')
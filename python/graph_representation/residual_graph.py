@@ -0,0 +1,164 @@
+from typing import Iterable, Iterator, Tuple, Union
+from array import array
+
+FlowEdge = Tuple[int, int, int]
+
+class ResidualGraph:
+    """
+    Residual graph of a flow network stored in flat parallel arrays
+
+    Every input edge u -> v with capacity c is stored as two arcs: arc 2i is
+    u -> v with capacity c and arc 2i + 1 is the reverse v -> u with capacity 0,
+    so the reverse of arc e is always e ^ 1. Pushing f units along e adds f to
+    flow[e] and subtracts f from flow[e ^ 1], so the residual capacity of any
+    arc is capacity[e] - flow[e].
+
+    The arcs out of u form a linked list through the `next` buffer, so edges
+    can be added one at a time without rebuilding anything.
+
+    Buffers:
+        - head: array('i'), head[e] is the vertex arc e points to
+        - capacity, flow: array('q') if every capacity is an int, otherwise
+          array('d')
+        - next: array('i'), the arc after e in its tail's list (-1 at the end)
+        - first: array('i') of length V, the first arc out of u (-1 if none)
+
+    Iterating the arcs out of u:
+        e = graph.first[u]
+        while e != -1:
+            v, residual = graph.head[e], graph.capacity[e] - graph.flow[e]
+            e = graph.next[e]
+    """
+    __slots__ = ('num_vertices', 'head', 'capacity', 'flow', 'next', 'first')
+
+    def __init__(self, num_vertices: int, integral: bool = True):
+        typecode = 'q' if integral else 'd'
+        self.num_vertices = num_vertices
+        self.head = array('i')
+        self.capacity = array(typecode)
+        self.flow = array(typecode)
+        self.next = array('i')
+        self.first = array('i', [-1]) * num_vertices
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges: Iterable[FlowEdge]) -> 'ResidualGraph':
+        """
+        Builds the residual graph of the edges (u, v, capacity). Edge i of the
+        input becomes arc 2i.
+
+        Time Complexity: O(V + E)
+        Aux Space Complexity: O(V + E)
+        """
+        if not isinstance(edges, list):
+            edges = list(edges)
+        integral = all(type(c) is int for _, _, c in edges)
+        graph = cls(num_vertices, integral)
+
+        E = len(edges)
+        head = graph.head = array('i', [0]) * (2 * E)
+        capacity = graph.capacity = array(graph.capacity.typecode, [0]) * (2 * E)
+        graph.flow = array(graph.flow.typecode, [0]) * (2 * E)
+        nxt = graph.next = array('i', [-1]) * (2 * E)
+        first = graph.first
+
+        for i, (u, v, c) in enumerate(edges):
+            e = 2 * i
+            head[e], capacity[e], nxt[e] = v, c, first[u]
+            first[u] = e
+            head[e + 1], nxt[e + 1] = u, first[v]
+            first[v] = e + 1
+        return graph
+
+    def add_edge(self, u: int, v: int, capacity) -> int:
+        """
+        Appends the edge u -> v and its reverse arc
+
+        Returns:
+            The index e of the new forward arc (the reverse is e + 1)
+
+        Time Complexity: O(1) amortised
+        """
+        e = len(self.head)
+        self.head.append(v)
+        self.capacity.append(capacity)
+        self.flow.append(0)
+        self.next.append(self.first[u])
+        self.first[u] = e
+
+        self.head.append(u)
+        self.capacity.append(0)
+        self.flow.append(0)
+        self.next.append(self.first[v])
+        self.first[v] = e + 1
+        return e
+
+    @property
+    def num_edges(self) -> int:
+        """Number of input edges (half the number of arcs)"""
+        return len(self.head) // 2
+
+    def residual(self, e: int):
+        """Residual capacity of arc e"""
+        return self.capacity[e] - self.flow[e]
+
+    def push(self, e: int, amount) -> None:
+        """Sends `amount` units of flow along arc e"""
+        self.flow[e] += amount
+        self.flow[e ^ 1] -= amount
+
+    def arcs(self, u: int) -> Iterator[int]:
+        """
+        Yields the indices of the arcs out of u (forward and reverse)
+
+        Time Complexity: O(degree(u))
+        """
+        nxt = self.next
+        e = self.first[u]
+        while e != -1:
+            yield e
+            e = nxt[e]
+
+    def edge_flows(self) -> array:
+        """Flow on every input edge, in input order"""
+        return self.flow[0::2]
+
+    def reset(self) -> None:
+        """Sets the flow on every arc back to 0"""
+        self.flow = array(self.flow.typecode, [0]) * len(self.flow)
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __repr__(self) -> str:
+        return f'ResidualGraph(num_vertices={self.num_vertices}, num_edges={self.num_edges})'
+
+
+def as_residual(graph: Union[ResidualGraph, Iterable[FlowEdge]], num_vertices: int) -> ResidualGraph:
+    """
+    Returns `graph` unchanged if it is already a ResidualGraph, otherwise builds
+    one from the edge list (u, v, capacity).
+    """
+    if isinstance(graph, ResidualGraph):
+        return graph
+    return ResidualGraph.from_edges(num_vertices, graph)
+
+
+if __name__ == '__main__':
+    edges = [(0, 1, 3), (0, 2, 2), (1, 2, 1), (2, 3, 4)]
+    graph = ResidualGraph.from_edges(4, edges)
+    assert graph.num_edges == 4
+    assert sorted(graph.head[e] for e in graph.arcs(2)) == [0, 1, 3]
+
+    # Push 2 units along 0 -> 1: the reverse arc gains 2 units of residual
+    graph.push(0, 2)
+    assert graph.residual(0) == 1 and graph.residual(1) == 2
+    assert list(graph.edge_flows()) == [2, 0, 0, 0]
+
+    e = graph.add_edge(3, 0, 5)
+    assert e == 8 and graph.head[e] == 0 and graph.head[e ^ 1] == 3
+    assert graph.residual(e ^ 1) == 0
+
+    graph.reset()
+    assert not any(graph.flow)
+
+    print('All tests passed')
@@ -33,9 +33,14 @@ Modelling:
 
 """
 
+import os
+import sys
 from typing import List, Tuple
 import math
-from collections import deque
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from graph_representation.csr_graph import CSRGraph
+from algorithms_graph.bellman_ford import bellman_ford_search
 
 City = int
 Toll = int
@@ -47,76 +52,45 @@ INF = math.inf
 def discounted_delivery(
     N: int, 
     M: int, 
-    roads: List[Road]
+    roads: List[Road],
+    backend: str = 'python'
 ) -> List[int]:
     """
     ! Discounted Delivery
     
     Finds the minimum cost to reach every city from city 1, or INF if unreachable.
     
-    Time Complexity: O(N * M)
+    With backend='numpy' the relaxation passes run as vectorized array
+    operations, which pays off when the same network is recomputed often.
+    
+    Time Complexity: O(N * M) worst case
     Time Complexity Analysis:
-        - Creating distance array: O(N)
-        - Creating predecessor array: O(N)
-        - Main loop:
-            - Looping through each city & road: O(N * M)
-            - Relaxation case: O(1)
-        - Final iteration to detect negative cycles: 
-            - Building adjacency list: O(M)
-            - Looping through each road: O(M)
-            - Checking and updating bad nodes: O(N + M)
-            - Setting distances for bad nodes: O(N)
-            
-        So O(N + N + N * M + M + M + N + M + N) = O(N * M)
+        - Building the CSR graph: O(N + M)
+        - Shared Bellman-Ford engine (SPFA): O(N * M) worst case, a node
+          queued N times is flagged as reachable from a negative cycle
+        - Marking everything reachable from the flagged nodes: O(N + M)
+        - Setting distances for bad nodes: O(N)
         
     Auxiliary Space Complexity: O(N + M)
     Auxiliary Space Complexity Analysis:
-        - Distance array: O(N)
-        - Ajdacency list: O(N + M)
-        - Bad nodes array: O(N)
+        - CSR graph: O(N + M)
+        - Distance, predecessor and flag arrays: O(N)
     
     Terms:
         - V: The number of cities.
         - M: The numer of roads.
     
     """
-    V = N + 1 
+    graph = CSRGraph.from_edges(
+        ((u, v, t - d) for u, v, t, d in roads),
+        num_vertices=N + 1
+    )
     
-    dist = [INF for _ in range(V)]
-    dist[1] = 0
-    
-    # (1) Relax edges V - 1 times
-    for _ in range(V - 1):
-        updated = False
-        for u,v,t,d in roads:
-            w = t - d
-            if dist[v] > dist[u] + w:
-                dist[v] = dist[u] + w
-                updated = True
-        if not updated:
-            break
+    # Vertices on or reachable from a negative cycle come back flagged
+    dist, _, bad = bellman_ford_search(graph, 1, backend=backend)
                 
-    # (2) Detect which vertices are on or reachable from negative cycles
-    bad = [False] * V
-    adj: List[List[int]] = [[] for _ in range(V)]
-    for u,v,_,_ in roads:
-        adj[u].append(v)
-    
-    for u,v,t,d in roads:
-        w = t - d
-        if dist[u] != INF and dist[v] > dist[u] + w:
-            bad[v] = True
-    
-    queue = deque(i for i, flag in enumerate(bad) if flag)
-    while queue:
-        x = queue.popleft()
-        for y in adj[x]:
-            if not bad[y]:
-                bad[y] = True
-                queue.append(y)
-                
-    # (3) Set distances to INF for all bad nodes
-    for i in range(V):
+    # Set distances to INF for all bad nodes
+    for i in range(N + 1):
         if bad[i]:
             dist[i] = INF
         
@@ -160,4 +134,12 @@ if __name__ == '__main__':
     result = discounted_delivery(N, M, roads)
     assert result == [0, INF, INF], f'Expected [0, inf, inf], got {result}'
     
+    # (3) Vectorized backend
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        assert discounted_delivery(N, M, roads, backend='numpy') == [0, INF, INF]
+    
     print('All tests passed!')
\ No newline at end of file
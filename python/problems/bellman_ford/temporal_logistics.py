@@ -19,64 +19,91 @@ Design an O(N*M)-time algorithm using Bellman-Ford (with one extra pass to
 detect negative cycles).
 """
 
-from typing import List, Tuple
-from collections import deque
+from array import array
+from typing import List, Optional, TextIO, Tuple
 import math
+import os
 import sys
 import io
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from graph_representation.csr_graph import CSRGraph
+from algorithms_graph.bellman_ford import bellman_ford_search
+
 INF = math.inf
 
-def temporal_logistics(
+# City states reported by temporal_logistics
+REACHABLE = 0
+UNREACHABLE = 1
+PARADOX = 2
+
+def city_states(
     N: int,
     M: int,
     roads: List[Tuple[int, int, int]]
+) -> Tuple[array, List]:
+    """
+    Computes the state and arrival time of every city j = 0..N
+    
+    Approach:
+    - Bellman-Ford (SPFA) from city 1 flags the cities it finds on negative
+    cycles.
+    - The flags are spread to every city reachable from them by walking the
+    SCC condensation in topological order, O(N + M).
+    
+    Returns:
+        A tuple (states, dist) where states is an array('b') of REACHABLE,
+        UNREACHABLE or PARADOX per city, and dist[j] is the minimum arrival
+        time of j (only meaningful when states[j] == REACHABLE).
+    
+    Time Complexity: O(N * M) worst case
+    Space Complexity: O(N + M)
+    """
+    V = N + 1
+    
+    graph = CSRGraph.from_edges(roads, num_vertices=V)
+    dist, _, in_neg_cycle = bellman_ford_search(graph, 1)
+    
+    states = array('b', [REACHABLE]) * V
+    for j in range(V):
+        if dist[j] == INF:
+            states[j] = UNREACHABLE
+        elif in_neg_cycle[j]:
+            states[j] = PARADOX
+    return states, dist
+
+def temporal_logistics(
+    N: int,
+    M: int,
+    roads: List[Tuple[int, int, int]],
+    out: Optional[TextIO] = None
 ) -> None:
     """
     Temporal Logistics
     
     Finds:
     - Prints minimum possible arrival to each city j.
-    - Prints UNREACHABLE for each city j that is part of a negative cycle.
+    - Prints UNREACHABLE for each city j that cannot be reached from city 1.
     - Prints PARADOX for any city that lies on or is reachable from a negative
         cycle reachable from city 1.
     
+    The report is built in memory and written with a single call to `out`
+    (sys.stdout by default), so it stays cheap for millions of cities.
+    
     Time Complexity: O(N * M)
     Space Complexity: O(N + M)
     """
-    V = N + 1
+    if out is None:
+        out = sys.stdout
     
-    dist = [INF] * V
-    dist[1] = 0
-    
-    for _ in range(V - 1):
-        for u,v,t in roads:
-            if dist[v] > dist[u] + t:
-                dist[v] = dist[u] + t
-                
-    in_neg_cycle = [False] * V
-    adj = [[] for _ in range(V)]
-    for u,v,t in roads:
-        adj[u].append(v)
-        
-        if dist[v] > dist[u] + t:
-            in_neg_cycle[v] = True
-            
-    queue = deque(i for i, flag in enumerate(in_neg_cycle) if flag)
-    while queue:
-        x = queue.popleft()
-        for y in adj[x]:
-            if not in_neg_cycle[y]:
-                in_neg_cycle[y] = True
-                queue.append(y)
-            
-    for j in range(V):
-        if dist[j] == INF:
-            print('UNREACHABLE')
-        elif in_neg_cycle[j]:
-            print('PARADOX')
-        else:
-            print(dist[j])
+    states, dist = city_states(N, M, roads)
+    labels = {UNREACHABLE: 'UNREACHABLE', PARADOX: 'PARADOX'}
+    lines = [
+        str(dist[j]) if state == REACHABLE else labels[state]
+        for j, state in enumerate(states)
+    ]
+    out.write('\n'.join(lines))
+    out.write('\n')
             
 
 if __name__ == '__main__':
@@ -130,6 +157,13 @@ if __name__ == '__main__':
     
     for expected, actual in zip(expected_lines, actual_lines):
         assert expected.strip() == actual.strip(), f'Line mismatch: Expected {expected} got {actual}'
+    
+    # Same report written to an explicit buffer, and as a typed array
+    buffer = io.StringIO()
+    temporal_logistics(N, len(roads), roads, out=buffer)
+    assert buffer.getvalue() == actual_output
+    states, _ = city_states(N, len(roads), roads)
+    assert list(states) == [UNREACHABLE, REACHABLE, PARADOX, PARADOX, PARADOX, PARADOX, REACHABLE, REACHABLE, UNREACHABLE]
         
     print('All tests passed')
     
\ No newline at end of file
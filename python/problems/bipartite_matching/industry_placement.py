@@ -20,43 +20,24 @@ any students not placed in this round would be placed in the following round.
 Describe how you would model this problem as a maximum flow problem which is 
 then solved using the ford fulkerson method.
 """
-from typing import List, Tuple, Dict, Optional
-import networkx as nx
+import os
+import sys
+from typing import List, Dict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from algorithms_graph.bipartite_assignment import capacitated_assignment
 
 def industry_placement(
     prefs: Dict[int, List[int]], 
     num_companies: int,
-    company_capacity: int = 8
-):
-    G = nx.DiGraph()
-    s = 'source'
-    t = 'sink'
-    
-    # Add edges source -> students (cap=1)
-    for stu in prefs:
-        G.add_edge(s, stu, capacity=1)
-    
-    # Add edges students -> companies (cap=1 with multiple edges for each pref)
-    for stu, coms in prefs.items():
-        for com in coms:
-            G.add_edge(stu, f'company_{com}', capacity=1)
-    
-    # Add edges companies -> sink (cap=company capacity = 8)
-    for com in range(1, num_companies + 1):
-        G.add_edge(f'company_{com}', t, capacity=company_capacity)
-    
-    # Compute max flow
-    flow_value, flow_dict = nx.maximum_flow(G, s, t)
-    
-    # Extract placements
-    placements = {}
-    for student in prefs:
-        for com in prefs[student]:
-            if flow_dict.get(student, {}).get(f'company_{com}', 0) == 1:
-                placements[student] = com
-                break
-            
-    return placements
+    company_capacity: int = 8,
+    ranked: bool = False
+) -> Dict[int, int]:
+    # source -> students (cap=1) -> preferred companies (cap=1) -> sink
+    # (cap=company capacity = 8), see capacitated_assignment
+    # With `ranked`, place as many students as before but prefer their
+    # earlier choices (min-cost flow with cost = preference rank)
+    return capacitated_assignment(prefs, num_companies, company_capacity, ranked=ranked)
 
 if __name__ == '__main__':
     prefs = {
@@ -69,4 +50,9 @@ if __name__ == '__main__':
     num_companies = 4
     company_capacity = 8
     placements = industry_placement(prefs, num_companies, company_capacity)
-    print("Industry placements:", placements)
\ No newline at end of file
+    print("Industry placements:", placements)
+    
+    # Ranked: with room for everyone, every student gets their first choice
+    ranked = industry_placement(prefs, num_companies, company_capacity, ranked=True)
+    print("Ranked placements:", ranked)
+    assert ranked == {stu: coms[0] for stu, coms in prefs.items()}
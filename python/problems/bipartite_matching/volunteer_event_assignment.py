@@ -28,43 +28,21 @@ Create sink node and connect from all sessions with edge capacity of
 
 Run max flow and get the assignments
 """
+import os
+import sys
 from typing import List, Dict
-import networkx as nx
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from algorithms_graph.bipartite_assignment import capacitated_assignment
 
 def assign_volunteers(
     preferences: Dict[int, List[int]],
     num_sessions: int,
     session_capacity: int = 4
 ) -> Dict[int, int]: 
-    G = nx.DiGraph()
-    source = 'src'
-    sink = 'sink'
-    
-    # Add edges source -> volunteers (cap=1)
-    for volunteer in preferences:
-        G.add_edge(source, volunteer, capacity=1)
-    
-    # Add edges volunteer -> session (cap=1) for each preference
-    for volunteer, sessions in preferences.items():
-        for session in sessions:
-            G.add_edge(volunteer, f'session_{session}', capacity=1)
-            
-    # Add edges session -> sink (cap=session_capacity) 
-    for s in range(1, num_sessions + 1):
-        G.add_edge(f'session_{s}', sink, capacity=session_capacity)
-        
-    # Compute max flow
-    flow_value, flow_dict = nx.maximum_flow(G, source, sink)
-    
-    # Extract assignments where flow_dict[volunteer][session] == 1
-    assignments = {}
-    for volunteer in preferences:
-        for s in preferences[volunteer]:
-            if flow_dict.get(volunteer, {}).get(f'session_{s}', 0) == 1:
-                assignments[volunteer] = s
-                break
-            
-    return assignments
+    # source -> volunteers (cap=1) -> preferred sessions (cap=1) -> sink
+    # (cap=session_capacity), see capacitated_assignment
+    return capacitated_assignment(preferences, num_sessions, session_capacity)
 
 if __name__ == '__main__':
     # Example: 5 volunteers, 4 sessions, each session holds at most 2 volunteers
@@ -17,11 +17,19 @@ return infinity.
 This can be modeled as a shortset path problem in a time-expanded graph and
 solved in O(N+M log N) time using a dijkstra style algorithm on states
 (current_time, airport).
+
+Since every flight departs before it arrives, it is even simpler to sort the
+flights by departure time once and scan them in order (Connection Scan), which
+is what `earliest_arrival` does.
 """
 
 from typing import List, Tuple
 import math
-import heapq
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from algorithms_graph.connection_scan import ConnectionScan, ArrivalProfile
 
 INF = math.inf
 
@@ -36,52 +44,52 @@ def earliest_arrival(
     Earliest Arrival Time
     
     Approach Description:
-    - Sort the flights by the departure time earliest to latest, so we can skip
-    flights early.
-    - Create adjacency list for all flights.
-    - Initialise a best array for best arrival times for each airport.
-    - Initialise starting state as 0 time
-    - Use min heap popping current time and current airport.
-    - We check the neighbouring airports and compare the departure time with 
-    the current time to see if we can actually catch the flight.
-    - We check if the arrival time is faster than the current best time for the
-    neighbouring airport. If so, we push that new state to the heap also marking
-    the new best.
-    - We return best[end]
+    - Build a Connection Scan index: the flights sorted by departure time and
+    stored as parallel arrays.
+    - Scan the flights in departure order. A flight can be caught if we have
+    already arrived at its departure airport by its departure time, and it
+    may improve the best arrival time at its destination airport.
+    - Stop once flights depart after the best arrival at `end`.
+    
+    To answer many queries on the same schedule, build a ConnectionScan once
+    and call its `earliest_arrival` / `earliest_arrivals` methods directly.
+    
+    Time Complexity: O(M log M) for the sort, then O(M) for the scan.
     
     Return:
         The earliest arrival time at `end` starting from `start` at time 0 or 
         INF if unreachable.
     """
-    N = N + 1
+    return ConnectionScan(N + 1, flights).earliest_arrival(start, end)
+
+def earliest_arrival_profile(
+    N: int,
+    M: int,
+    flights: List[Tuple[int,int,int,int]],
+    start: int,
+    end: int
+) -> ArrivalProfile:
+    """
+    Earliest Arrival Profile
     
-    # Sort the flights by departure time
-    flights = sorted(flights, key = lambda x : x[2])
+    The earliest arrival time at `end` for EVERY possible departure time from
+    `start`, instead of only from time 0.
     
-    adj = [[] for _ in range(N)]
-    for u,v,d,a in flights:
-        adj[u].append((d,a,v))
-        
-    best = [INF] * N
-    best[start] = 0
+    Approach Description:
+    - Scan the flights once from the latest departure to the earliest.
+    - Each airport keeps its Pareto-optimal (departure, arrival at `end`)
+    pairs. A flight u -> v arrives at `end` either directly (v == end) or via
+    the best pair of v that departs after the flight lands.
+    - A new pair is only kept at u if it arrives strictly earlier than every
+    pair at u that departs later.
     
-    heap = [(0, start)]
-    while heap:
-        curr_time, curr = heapq.heappop(heap)
-        
-        if curr_time > best[curr]:
-            continue
-        
-        if curr == end:
-            return best[curr]
-        
-        for departure, arrival, airport in adj[curr]:
-            if departure >= curr_time:
-                if arrival < best[airport]: 
-                    best[airport] = arrival
-                    heapq.heappush(heap, (arrival, airport))
+    Time Complexity: O(M log M)
     
-    return best[end]
+    Return:
+        A step function whose `evaluate(t)` gives the earliest arrival at `end`
+        when leaving `start` at time t (INF if unreachable), in O(log M).
+    """
+    return ConnectionScan(N + 1, flights).profile(start, end)
         
 if __name__ == '__main__':
     # Test case:
@@ -108,4 +116,16 @@ if __name__ == '__main__':
     exp = 8
     assert res == exp, f'Expected {exp}, got {res}'
     
+    # Prebuilt index answering a batch of queries
+    index = ConnectionScan(N + 1, flights)
+    res = list(index.earliest_arrivals([(1, 4), (1, 3), (4, 1)]))
+    exp = [8, 3, INF]
+    assert res == exp, f'Expected {exp}, got {res}'
+    
+    # Profile: leaving airport 1 at time <= 2 arrives at 8, later is hopeless
+    profile = earliest_arrival_profile(N, M, flights, start, end)
+    res = [profile.evaluate(t) for t in range(4)]
+    exp = [8, 8, 8, INF]
+    assert res == exp, f'Expected {exp}, got {res}'
+    
     print('All tests passed!')
\ No newline at end of file
@@ -20,47 +20,74 @@ This is a class single-source shortest-path problem on a graph with
 non-negative weights and is solved by Dijkstra algorithm in O((N+M) log N) time.
 """
 
-from typing import List, Tuple
-import heapq
+from typing import List, Optional, Sequence, Tuple, Union
 import math
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from graph_representation.csr_graph import CSRGraph, as_csr
+from algorithms_graph.dijkstra import dijkstra_distances, bidirectional_dijkstra
+from algorithms_graph.alt import LandmarkIndex
+from algorithms_graph.distance_table import distance_table
 
 INF = math.inf
 
 def min_travel_time(
     num_cities: int,
-    roads: List[Tuple[int,int,int]],
+    roads: Union[List[Tuple[int,int,int]], CSRGraph],
     start: int,
-    end: int
+    end: int,
+    reverse_roads: Optional[CSRGraph] = None,
+    landmarks: Optional[LandmarkIndex] = None
 ):
+    """
+    Minimum Travel Time
+    
+    Approach Description:
+    - Build the CSR graph of the roads (or reuse a prebuilt one).
+    - Run the shared Dijkstra in target-aware mode, which stops as soon as
+    `end` is settled instead of settling every city.
+    - If the reverse road graph is also given, run bidirectional Dijkstra
+    instead, which searches from both ends and meets in the middle.
+    - If a landmark index is given (preprocessed once for a static road
+    network), run an ALT A* query instead.
+    
+    Return:
+        The minimum travel time from `start` to `end`, or INF if unreachable.
+    """
     n = num_cities + 1
     
-    # Build adjacency list
-    adj = [[] for _ in range(n)]
-    for u,v,t in roads:
-        adj[u].append((v,t))
-        
-    visited = [INF] * n
-    visited[start] = 0
+    # Build the CSR graph once (or reuse a prebuilt one across queries)
+    graph = as_csr(roads, num_vertices=n)
+    
+    if landmarks is not None:
+        return landmarks.query(graph, start, end)
     
-    heap = [(0, start)]
-    while heap:
-        curr_dist, curr_city = heapq.heappop(heap)
-        
-        if curr_dist > visited[curr_city]:
-            continue
-        
-        if curr_city == end:
-            return curr_dist
-        
-        for neighbour, dist in adj[curr_city]:
-            new_dist = curr_dist + dist
-            
-            if new_dist < visited[neighbour]:
-                visited[neighbour] = new_dist
+    if reverse_roads is not None:
+        return bidirectional_dijkstra(graph, start, end, reverse_roads)
+    
+    return dijkstra_distances(graph, start, target=end)[end]
 
-                heapq.heappush(heap, (new_dist, neighbour))
-                
-    return INF
+def min_travel_time_table(
+    num_cities: int,
+    roads: Union[List[Tuple[int,int,int]], CSRGraph],
+    starts: Sequence[int],
+    ends: Sequence[int],
+    use_numpy: Optional[bool] = None
+):
+    """
+    Minimum travel times for every (start, end) pair
+    
+    Builds the road graph once and runs one Dijkstra per start city (sharing
+    scratch buffers), instead of calling min_travel_time once per pair.
+    
+    Return:
+        A len(starts) x len(ends) matrix of travel times (INF if unreachable),
+        as a flat row-major array('d') or a NumPy array when available.
+    """
+    graph = as_csr(roads, num_vertices=num_cities + 1)
+    return distance_table(graph, starts, ends, use_numpy)
                 
 if __name__ == '__main__':
     n = 5
@@ -80,4 +107,27 @@ if __name__ == '__main__':
     
     assert res == exp, f'Expected {exp}, got {res}'
     
+    # Build the graph once and reuse it for several queries
+    graph = CSRGraph.from_edges(roads, num_vertices=n + 1)
+    assert min_travel_time(n, graph, 1, 5) == 5
+    assert min_travel_time(n, graph, 2, 5) == 3
+    assert min_travel_time(n, graph, 5, 1) == INF
+    
+    # Bidirectional search with a prebuilt reverse graph
+    reverse = graph.reverse()
+    assert min_travel_time(n, graph, 1, 5, reverse) == 5
+    assert min_travel_time(n, graph, 5, 1, reverse) == INF
+    
+    # ALT query with landmarks preprocessed once
+    index = LandmarkIndex.build(graph, k=2, reverse=reverse, first=1)
+    assert min_travel_time(n, graph, 1, 5, landmarks=index) == 5
+    assert min_travel_time(n, graph, 5, 1, landmarks=index) == INF
+    
+    # Cost matrix for several starts and ends in one call
+    starts, ends = [1, 2, 5], [3, 5]
+    table = min_travel_time_table(n, roads, starts, ends, use_numpy=False)
+    for i, s in enumerate(starts):
+        for j, t in enumerate(ends):
+            assert table[i * len(ends) + j] == min_travel_time(n, graph, s, t)
+    
     print('All tests passed')
\ No newline at end of file
@@ -16,7 +16,8 @@ FlowNetworkEdge = Tuple[int, int, int]
 
 def is_feasible_circulation(
     num_original_vertices: int,
-    edges_with_demand: List[OriginalEdgeWithDemand]
+    edges_with_demand: List[OriginalEdgeWithDemand],
+    algorithm: str = 'dfs'
 ) -> bool:
     net_demands = [0] * num_original_vertices
 
@@ -66,7 +67,7 @@ def is_feasible_circulation(
     
     # Calculate the max flow in the constructed network
     max_flow = ford_fulkerson(
-        num_flow_network_vertices, flow_edges, super_source, super_sink
+        num_flow_network_vertices, flow_edges, super_source, super_sink, algorithm
     )
     
     # A feasible circulation exists if the max flow equals the total demand 
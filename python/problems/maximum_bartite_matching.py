@@ -5,6 +5,7 @@ from typing import List, Tuple
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from algorithms_graph.ford_fulkerson import ford_fulkerson
+from algorithms_graph.hopcroft_karp import hopcroft_karp
 
 
 BipartiteEdge = Tuple[int, int]
@@ -13,7 +14,8 @@ Edge = Tuple[int, int, int]
 def max_bartite_matching(
     num_lhs: int, 
     num_rhs: int, 
-    bipartite_edges: List[BipartiteEdge]
+    bipartite_edges: List[BipartiteEdge],
+    algorithm: str = 'hopcroft_karp'
 ) -> int:
     """
     Calculates the maximum matching in a bipartite graph using FordFulkerson
@@ -26,7 +28,15 @@ def max_bartite_matching(
     
     Note that all edge connections have a capacity of 1, the we simply run
     ford fulkerson and output the result because max flow = max matchings.
+    
+    `algorithm` is 'hopcroft_karp' (default) to skip the flow network and
+    match directly with Hopcroft-Karp in O(E * sqrt(V)), see hopcroft_karp for
+    the matched pairs. Otherwise it selects the max-flow engine ('dfs',
+    'scaling', 'dinic' or 'push_relabel', see ford_fulkerson).
     """
+    if algorithm == 'hopcroft_karp':
+        return hopcroft_karp(num_lhs, num_rhs, bipartite_edges)[0]
+    
     super_source = 0
     super_sink = num_lhs + num_rhs + 1
     
@@ -51,7 +61,7 @@ def max_bartite_matching(
         edges.append((u, v, 1))
         
     # Calculate max flow using FordFulkerson
-    return int(ford_fulkerson(num_vertices, edges, super_source, super_sink))
+    return int(ford_fulkerson(num_vertices, edges, super_source, super_sink, algorithm))
 
 
 if __name__ == '__main__':
@@ -72,4 +82,7 @@ if __name__ == '__main__':
     print(f'Edges: {edges}')
     print(f'Maximum Bipartite Matching size: {max_matching}') # Expected 2
     assert max_matching == 2, f'Test case 1 Failed: Expected 2, got {max_matching}'
-    print('Test Case 1 Passed\n')
\ No newline at end of file
+    print('Test Case 1 Passed\n')    
+    # ? Same matching with Dinic's algorithm
+    assert max_bartite_matching(num_lhs, num_rhs, edges, algorithm='dinic') == 2
+    assert max_bartite_matching(num_lhs, num_rhs, edges, algorithm='dfs') == 2
@@ -4,7 +4,7 @@ from typing import List, Tuple
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from algorithms_graph.ford_fulkerson import ford_fulkerson
+from algorithms_graph.flow_network import FlowNetwork
 
 """
 Problem 4. 
@@ -32,12 +32,23 @@ FlowEdge = Tuple[int, int, int]
 # (job1_id, job2_id, penalty_cost)
 RelatedPairPenalty = Tuple[JobID, JobID, Cost]
 
-def optimal_job_allocation(
+def job_allocation_network(
     num_jobs: int, 
     costs_computer1: List[Cost], 
     costs_computer2: List[Cost],
-    related_jobs_penalties: List[RelatedPairPenalty]
-) -> Cost:
+    related_jobs_penalties: List[RelatedPairPenalty],
+    algorithm: str = 'dfs'
+) -> FlowNetwork:
+    """
+    Builds the min-cut network of the allocation problem as a FlowNetwork, so
+    a changed cost or penalty only needs set_capacity() and resolve().
+    
+    Edge numbers:
+        - 2j: Source -> Job_j, capacity costs_computer2[j]
+        - 2j + 1: Job_j -> Sink, capacity costs_computer1[j]
+        - 2 * num_jobs + 2k and 2 * num_jobs + 2k + 1: both directions of the
+          k-th related pair, capacity its penalty
+    """
     source_node = 0
     
     sink_node = num_jobs + 1
@@ -64,15 +75,32 @@ def optimal_job_allocation(
         
         flow_network_edges.append((i_node_idx, j_node_idx, penalty))
         flow_network_edges.append((j_node_idx, i_node_idx, penalty))
-        
-    # 4. Calculate the max flow (which equals min cut)
-    min_total_cost = ford_fulkerson(
-        num_total_vertices,
-        flow_network_edges,
-        source_node,
-        sink_node
+    
+    return FlowNetwork(num_total_vertices, flow_network_edges, source_node, sink_node, algorithm)
+
+def job_computers(network: FlowNetwork, num_jobs: int) -> List[int]:
+    """
+    Computer (1 or 2) of every job in an optimal allocation: jobs on the
+    source side of the min cut have their Job -> Sink edge cut, so they pay
+    their computer 1 cost.
+    """
+    source_side = network.min_cut()
+    return [1 if source_side >> (j + 1) & 1 else 2 for j in range(num_jobs)]
+
+def optimal_job_allocation(
+    num_jobs: int, 
+    costs_computer1: List[Cost], 
+    costs_computer2: List[Cost],
+    related_jobs_penalties: List[RelatedPairPenalty],
+    algorithm: str = 'dfs'
+) -> Cost:
+    network = job_allocation_network(
+        num_jobs, costs_computer1, costs_computer2, related_jobs_penalties, algorithm
     )
     
+    # 4. Calculate the max flow (which equals min cut)
+    min_total_cost = network.resolve()
+    
     return int(min_total_cost) 
 
 if __name__ == '__main__':
@@ -132,4 +160,15 @@ if __name__ == '__main__':
     # J1: C1=100, C2=5 -> Choose C2 (cost 5)
     # Total = 10 + 5 = 15
     assert min_cost_ex2 == 15, f"Test Case 2 Failed: Expected 15, got {min_cost_ex2}"
-    print("Test Case 2 Passed!")
\ No newline at end of file
+    print("Test Case 2 Passed!")
+
+    # Example 3: Changing one cost re-solves from the previous flow
+    network = job_allocation_network(num_jobs_ex1, costs_c1_ex1, costs_c2_ex1, related_ex1)
+    assert network.resolve() == 14
+    assert job_computers(network, num_jobs_ex1) == [2, 1]
+    # Job 0 now costs 20 on C2 (edge 0 is Source -> Job_0)
+    network.set_capacity(0, 20)
+    # J0 on C1, J1 on C1: 10 + 6 = 16
+    assert network.resolve() == 16, f"Test Case 3 Failed: Expected 16, got {network.value}"
+    assert job_computers(network, num_jobs_ex1) == [1, 1]
+    print("Test Case 3 Passed!")